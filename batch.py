@@ -0,0 +1,744 @@
+"""Batch certificate generation, serially or across a process pool.
+
+Like renderer.py this module only depends on Pillow so that worker
+processes never have to import Tkinter.
+"""
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+
+from encoders import RGBX_FORMATS
+from renderer import CertificateRenderer, OutputAllocator, file_digest, share_template
+from sinks import open_archive_sink
+from sources import NAME_FIELD
+
+# Tasks kept in flight per worker so the pool never starves between results
+TASKS_PER_WORKER = 4
+# Job manifest written into the output directory
+MANIFEST_NAME = ".certificates_manifest.jsonl"
+# Finished certificates remembered for duplicate names, and how many
+# bytes of encoded archive images they may hold
+RENDER_CACHE_ENTRIES = 10000
+RENDER_CACHE_BYTES = 64 << 20
+# Background threads saving loose files, and the encoded bytes that may wait
+# for them before rendering pauses
+WRITER_THREADS = 4
+WRITE_QUEUE_BYTES = 64 << 20
+
+# Per-process renderer, built once by _init_worker
+_worker_renderer = None
+# Seconds _init_worker spent loading it, reported with the worker's first result
+_worker_load_seconds = None
+
+
+class BatchControl:
+    """Thread-safe pause/cancel switches for a running batch"""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        # Wake a paused batch so it can notice the cancellation
+        self._running.set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def checkpoint(self):
+        """Block while paused; return False once the batch is cancelled"""
+        self._running.wait()
+        return not self.cancelled
+
+
+@dataclass
+class BatchStats:
+    """Wall time per pipeline stage and output counters for a batch
+
+    Stage times are summed over all certificates (and all workers), so
+    with several jobs they can add up to more than the elapsed time.
+    """
+    stage_seconds: dict = field(default_factory=dict)
+    stage_counts: dict = field(default_factory=dict)
+    stage_max: dict = field(default_factory=dict)
+    bytes_written: int = 0
+    elapsed: float = 0.0
+
+    def add(self, timings):
+        """Fold in a ``{stage: seconds}`` dict measured for one item"""
+        for stage, seconds in timings.items():
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+            self.stage_counts[stage] = self.stage_counts.get(stage, 0) + 1
+            if seconds > self.stage_max.get(stage, 0.0):
+                self.stage_max[stage] = seconds
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch run"""
+    success_count: int = 0
+    skipped_count: int = 0
+    # Certificates copied from an identical one instead of rendered (also in success_count)
+    reused_count: int = 0
+    failed_names: list = field(default_factory=list)
+    # Set when certificates were streamed into a ZIP/TAR archive
+    archive_path: str = ""
+    jobs: int = 1
+    stats: BatchStats = field(default_factory=BatchStats)
+
+
+@dataclass
+class RenderedItem:
+    """One certificate as it comes back from a render path"""
+    key: str
+    name: str
+    path: str
+    # Text for the spec's extra fields, by column
+    values: dict = None
+    error: str = None
+    # Encoded image still to be written to an archive; None once saved
+    data: bytes = None
+    size: int = 0
+    # Copied from an identical certificate rather than rendered
+    reused: bool = False
+    # Seconds spent per stage on this certificate
+    timings: dict = field(default_factory=dict)
+
+
+class JobManifest:
+    """Append-only record of finished certificates, used to resume a batch
+
+    Each line is a JSON object mapping a render key (a hash of everything
+    that affects the output, plus the occurrence number for repeated
+    names) to the file it was written to. Lines are flushed as soon as a
+    certificate is saved, so a crashed run loses at most the certificates
+    that were still in flight. With ``fsync`` each line is also flushed to
+    disk, so after a power cut the manifest never lists more than the
+    (equally fsynced) files that survived.
+    """
+
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        # Output paths are stored relative to the manifest so the folder can move
+        self.base_dir = os.path.dirname(os.path.abspath(path))
+        self._done = {}
+        self._file = None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._done[entry["key"]] = entry["path"]
+                    except (ValueError, KeyError, TypeError):
+                        # A run killed mid-write can leave a partial last line
+                        continue
+
+    @classmethod
+    def for_output(cls, output):
+        return cls(os.path.join(output.output_dir, MANIFEST_NAME), fsync=output.fsync)
+
+    def finished_path(self, key):
+        """Path of a finished certificate for this key, if it is still on disk"""
+        path = self._done.get(key)
+        if path:
+            path = os.path.join(self.base_dir, path)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def record(self, key, name, path):
+        path = os.path.relpath(os.path.abspath(path), self.base_dir)
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps({"key": key, "name": name, "path": path}, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._done[key] = path
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RenderCache:
+    """Finished certificates by content, so duplicate names are copied, not rendered
+
+    Entries are keyed by render key without its occurrence number, i.e. by
+    the template, font, settings, encoder, name and field values, so two
+    entries only match when their output would be byte-identical. Entries
+    keep the encoded bytes when the caller still has them (certificates
+    rendered in this process, and archives); otherwise the bytes are read
+    back from the first file on disk. Either way the duplicate is saved by
+    the caller like any encoded certificate. The least recently used entries
+    are dropped beyond max_entries. Beyond max_bytes of encoded data the
+    oldest entries let go of their bytes and fall back to their file, or
+    are dropped when ``on_disk`` is False (archives have no such file).
+    """
+
+    def __init__(self, max_entries=RENDER_CACHE_ENTRIES, max_bytes=RENDER_CACHE_BYTES, on_disk=True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.on_disk = on_disk
+        # content key -> (path, encoded bytes or None, size)
+        self._entries = OrderedDict()
+        # Content keys of entries holding bytes, least recently used first
+        self._held = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def content_key(key):
+        # Render keys end in ":<occurrence>"; duplicates share everything before it
+        return key.partition(":")[0]
+
+    def get(self, key):
+        content = self.content_key(key)
+        entry = self._entries.get(content)
+        if entry is not None:
+            self._entries.move_to_end(content)
+            if content in self._held:
+                self._held.move_to_end(content)
+        return entry
+
+    def add(self, item):
+        """Remember a successfully rendered certificate"""
+        content = self.content_key(item.key)
+        if content in self._entries:
+            return
+        self._entries[content] = (item.path, item.data, item.size)
+        if item.data is not None:
+            self._held[content] = None
+            self._bytes += len(item.data)
+        while len(self._entries) > self.max_entries:
+            oldest, (_, data, _) = self._entries.popitem(last=False)
+            if data is not None:
+                del self._held[oldest]
+                self._bytes -= len(data)
+        while self._bytes > self.max_bytes:
+            oldest, _ = self._held.popitem(last=False)
+            path, data, size = self._entries[oldest]
+            self._bytes -= len(data)
+            if self.on_disk:
+                self._entries[oldest] = (path, None, size)
+            else:
+                del self._entries[oldest]
+
+    def copy(self, item, output):
+        """Fill in a duplicate from its finished twin; returns False if there is none
+
+        The twin's encoded bytes go into ``item.data`` for the caller to save,
+        so copies are written (and fsynced) like everything else. A twin whose
+        file can't be read (moved, deleted, or not completely written yet)
+        counts as missing, so the duplicate is simply rendered.
+        """
+        entry = self.get(item.key)
+        if entry is None:
+            return False
+        path, data, size = entry
+        start = time.perf_counter()
+        if data is None:
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                return False
+            if len(data) != size:
+                return False
+        item.data = data
+        item.size = size
+        item.reused = True
+        _lap(item.timings, "copy", start)
+        return True
+
+
+class BackgroundWriter:
+    """Saves encoded certificates on background threads while rendering continues
+
+    ``write(item)`` persists ``item.data``; a failure becomes the item's
+    error. At most ``max_bytes`` of encoded data wait to be written (always
+    at least one item): submit() blocks beyond that, so a slow disk throttles
+    rendering instead of filling memory. Written items are collected with
+    finished(), in completion order, and all of them with drain().
+    """
+
+    def __init__(self, write, threads=WRITER_THREADS, max_bytes=WRITE_QUEUE_BYTES):
+        self._write = write
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="certificate-writer")
+        self._condition = threading.Condition()
+        self._queued_bytes = 0
+        self._queued = 0
+        self._finished = []
+
+    def submit(self, item):
+        """Queue an item for writing, waiting while the queue is full"""
+        size = len(item.data)
+        with self._condition:
+            while self._queued and self._queued_bytes + size > self.max_bytes:
+                self._condition.wait()
+            self._queued_bytes += size
+            self._queued += 1
+        self._executor.submit(self._run, item, size)
+
+    def _run(self, item, size):
+        start = time.perf_counter()
+        try:
+            self._write(item)
+        except Exception as e:
+            item.error = str(e)
+        item.data = None
+        _lap(item.timings, "write", start)
+        with self._condition:
+            self._queued_bytes -= size
+            self._queued -= 1
+            self._finished.append(item)
+            self._condition.notify_all()
+
+    def finished(self):
+        """Items written (or failed) since the last call"""
+        with self._condition:
+            items, self._finished = self._finished, []
+        return items
+
+    def drain(self):
+        """Wait for every queued write; returns the items not yet collected"""
+        with self._condition:
+            while self._queued:
+                self._condition.wait()
+        return self.finished()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+def _write_file(path, data, fsync=False):
+    """Write a certificate file, optionally flushing it to the disk itself"""
+    with open(path, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _fsync_path(path):
+    """Flush an already written file (such as a closed archive) to disk"""
+    with open(path, "ab") as f:
+        os.fsync(f.fileno())
+
+
+def batch_fingerprint(spec, output):
+    """Hash of the render inputs shared by every certificate in a batch"""
+    parts = asdict(spec)
+    parts["template_path"] = file_digest(spec.template_path)
+    # Fonts by content, so replacing a font file at the same path invalidates the run
+    if spec.font_path and os.path.exists(spec.font_path):
+        parts["font_path"] = file_digest(spec.font_path)
+    for field_parts in parts["fields"]:
+        if field_parts["font_path"] and os.path.exists(field_parts["font_path"]):
+            field_parts["font_path"] = file_digest(field_parts["font_path"])
+    parts["encoder"] = asdict(output.encoder)
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def render_key(fingerprint, name, values=None):
+    """Hash identifying one certificate's inputs"""
+    text = f"{fingerprint}\0{name}"
+    if values:
+        text += "\0" + json.dumps(values, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def default_jobs():
+    """Number of worker processes to use when not specified"""
+    return os.cpu_count() or 1
+
+
+def _lap(timings, stage, start):
+    """Add the time since start to a stage and return the current time"""
+    now = time.perf_counter()
+    timings[stage] = timings.get(stage, 0.0) + now - start
+    return now
+
+
+def _init_worker(spec, shared, image_format):
+    """Map the shared template and load the font once when a worker process starts
+
+    Formats that encode from RGBX draw on a copy-on-write mapping of the
+    template, so a worker only holds the pages its text touches; PNG needs
+    an RGB canvas, which render_incremental copies from the template.
+    """
+    global _worker_renderer, _worker_load_seconds
+    start = time.perf_counter()
+    try:
+        template = shared.open()
+        canvas = shared.open_private() if image_format in RGBX_FORMATS else None
+    except (OSError, ValueError):
+        # The file went away (e.g. evicted from the cache); load the template here
+        template = canvas = None
+    _worker_renderer = CertificateRenderer(spec, template=template, canvas=canvas)
+    _worker_load_seconds = time.perf_counter() - start
+
+
+def _render_one(renderer, item, output, save=True):
+    """Render and encode a certificate, then save it
+
+    The encoded bytes are kept in ``item.data`` instead, for the caller to
+    write, for archive output or when ``save`` is False.
+    """
+    start = time.perf_counter()
+    layout = renderer.layout(item.name)
+    start = _lap(item.timings, "measure", start)
+    img = renderer.render_incremental(item.name, layout, item.values)
+    start = _lap(item.timings, "draw", start)
+    data = renderer.encode(img, output)
+    start = _lap(item.timings, "encode", start)
+    item.size = len(data)
+    if output.archive or not save:
+        item.data = data
+        return item
+    _write_file(item.path, data, output.fsync)
+    _lap(item.timings, "write", start)
+    return item
+
+
+def _render_task(item, output):
+    """Render and save one certificate inside a worker process"""
+    global _worker_load_seconds
+    if _worker_load_seconds is not None:
+        item.timings["load"], _worker_load_seconds = _worker_load_seconds, None
+    try:
+        return _render_one(_worker_renderer, item, output)
+    except Exception as e:
+        item.error = str(e)
+        return item
+
+
+def _render_serial(items, output, allocator, renderer, control, cache):
+    """Yield a RenderedItem per item, rendered in this process
+
+    Items come back with their encoded bytes, for the caller to save in
+    the background while the next one renders.
+    """
+    for key, name, values in items:
+        if not control.checkpoint():
+            return
+        item = RenderedItem(key, name, allocator.allocate(name), values)
+        if cache is not None and cache.copy(item, output):
+            yield item
+            continue
+        try:
+            yield _render_one(renderer, item, output, save=False)
+        except Exception as e:
+            item.error = str(e)
+            yield item
+
+
+def _render_parallel(spec, items, output, allocator, jobs, control, stats, cache):
+    """Yield RenderedItems in completion order from a process pool
+
+    With a cache, a duplicate of a certificate that is still being rendered
+    waits for it and is then copied; waiting items count as in flight.
+    """
+    max_in_flight = jobs * TASKS_PER_WORKER
+    pending = set()
+    # Duplicates waiting on an in-flight certificate, by content key
+    waiting = {}
+    held = 0
+    items = iter(items)
+    # Nothing left to render (e.g. a resumed run that skips everything):
+    # don't share the template or start any workers
+    first = next(items, None)
+    if first is None:
+        return
+    items = itertools.chain([first], items)
+
+    # Decoded once here; every worker maps the same pixels
+    start = time.perf_counter()
+    shared = share_template(spec.template_path)
+    stats.add({"load": time.perf_counter() - start})
+
+    # Spawn rather than fork: the parent may be running a Tk event loop
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(spec, shared, output.encoder.image_format)
+        ) as executor:
+            while True:
+                # While paused, in-flight tasks finish but nothing new is queued
+                if not pending or not control.paused:
+                    for key, name, values in items:
+                        if not control.checkpoint():
+                            break
+                        # Paths are assigned here so two workers never pick the same file
+                        item = RenderedItem(key, name, allocator.allocate(name), values)
+                        if cache is None:
+                            pending.add(executor.submit(_render_task, item, output))
+                        elif cache.copy(item, output):
+                            yield item
+                        elif cache.content_key(key) in waiting:
+                            waiting[cache.content_key(key)].append(item)
+                            held += 1
+                        else:
+                            waiting[cache.content_key(key)] = []
+                            pending.add(executor.submit(_render_task, item, output))
+                        if len(pending) + held >= max_in_flight:
+                            break
+                if control.cancelled:
+                    # Drop queued tasks; ones already running are allowed to finish
+                    pending = {future for future in pending if not future.cancel()}
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = future.result()
+                    # The caller adds a saved certificate to the cache before resuming here
+                    yield item
+                    if cache is None:
+                        continue
+                    for duplicate in waiting.pop(cache.content_key(item.key), ()):
+                        held -= 1
+                        if cache.copy(duplicate, output):
+                            yield duplicate
+                        else:
+                            # The first one failed; render this one itself
+                            pending.add(executor.submit(_render_task, duplicate, output))
+    finally:
+        shared.close()
+
+
+def _render_pdf(spec, items, output, allocator, control, stats):
+    """Yield RenderedItems while writing PDF certificates"""
+    # Imported here so reportlab is only needed when PDF output is used
+    from pdfoutput import PdfCertificateWriter
+
+    start = time.perf_counter()
+    writer = PdfCertificateWriter(spec, output.encoder)
+    stats.add({"load": time.perf_counter() - start})
+    if not output.encoder.single_file:
+        for key, name, values in items:
+            if not control.checkpoint():
+                return
+            item = RenderedItem(key, name, allocator.allocate(name), values)
+            start = time.perf_counter()
+            try:
+                writer.write(item.path, name, values)
+                item.size = os.path.getsize(item.path)
+            except Exception as e:
+                item.error = str(e)
+            _lap(item.timings, "pdf", start)
+            yield item
+        return
+
+    path = allocator.allocate_stem("certificates")
+    pdf = writer.open(path)
+    try:
+        for key, name, values in items:
+            if not control.checkpoint():
+                break
+            item = RenderedItem(key, name, path, values)
+            start = time.perf_counter()
+            try:
+                writer.add_page(pdf, name, values)
+            except Exception as e:
+                item.error = str(e)
+            _lap(item.timings, "pdf", start)
+            yield item
+    finally:
+        # A cancelled run still leaves a valid document with the pages so far
+        start = time.perf_counter()
+        pdf.save()
+        stats.add({"write": time.perf_counter() - start})
+        stats.bytes_written += os.path.getsize(path)
+
+
+def _progress_fraction(names, total_names, done):
+    """Share of the batch finished, from the count or the source's own estimate"""
+    if total_names:
+        return done / total_names
+    if hasattr(names, "fraction"):
+        return names.fraction()
+    return 0.0
+
+
+def _entries(spec, names):
+    """Yield ``(name, values)`` per input; values fill the spec's extra fields"""
+    if spec.fields and hasattr(names, "rows"):
+        # Extra fields need the whole row, not just the name
+        names = names.rows()
+    for entry in names:
+        if not isinstance(entry, dict):
+            yield entry, None
+            continue
+        name = str(entry.get(NAME_FIELD) or "").strip()
+        if name:
+            yield name, {text_field.column: entry.get(text_field.column) for text_field in spec.fields}
+
+
+def _pending_items(entries, fingerprint, manifest, resume, skipped):
+    """Pair each entry with its render key, dropping finished ones when resuming"""
+    occurrences = {}
+    for name, values in entries:
+        key = None
+        if fingerprint is not None:
+            digest = render_key(fingerprint, name, values)
+            occurrences[digest] = occurrences.get(digest, 0) + 1
+            key = f"{digest}:{occurrences[digest]}"
+            if resume and manifest is not None and manifest.finished_path(key):
+                skipped[0] += 1
+                continue
+        yield key, name, values
+
+
+def generate_certificates(spec, names, output, jobs=1, renderer=None, progress=None,
+                          control=None, manifest=None, resume=False, reuse_duplicates=True):
+    """Render and save one certificate per name
+
+    ``names`` may be a list or any lazy iterable such as a NameSource; it
+    is consumed once, so arbitrarily long inputs use bounded memory.
+    Entries may also be row dicts (with the name under "name"); when the
+    spec has extra fields they are filled from the row's columns, and a
+    NameSource is read through its ``rows()`` for that.
+    With ``jobs`` > 1 the names are rendered and encoded by a pool of
+    worker processes; the template is decoded once here and mapped by
+    every worker, and each worker loads the font once.
+    ``progress`` is called as ``progress(done, fraction)`` as results come
+    in; when ``names`` has no length, ``fraction`` comes from its
+    ``fraction()`` method if it has one (e.g. bytes read of the input).
+    ``control`` is an optional BatchControl used to pause or cancel the
+    batch from another thread; a cancelled batch returns early.
+    PDF output (``output.encoder.image_format == "PDF"``) is written in
+    this process as one document, or one per name. With ``output.archive``
+    set, encoded images are streamed into a single ZIP/TAR file instead of
+    being saved as loose files.
+    Certificates rendered in this process are saved by background threads
+    (see BackgroundWriter) while the next ones render; with several jobs
+    each worker saves its own. ``output.fsync`` flushes every file to disk
+    before it is counted.
+    Every saved certificate is recorded in ``manifest`` (a JobManifest) if
+    given; with ``resume`` names already recorded there with identical
+    render inputs, and whose file still exists, are skipped.
+    With ``reuse_duplicates`` a name repeated with identical inputs is
+    copied from its first certificate instead of being rendered and
+    encoded again (see RenderCache); PDF output always renders every name.
+    Returns a BatchResult; each failure is a ``"name: reason"`` string,
+    and ``stats`` holds the time spent per stage and the bytes written.
+    """
+    started = time.perf_counter()
+    if control is None:
+        control = BatchControl()
+    total_names = len(names) if hasattr(names, "__len__") else None
+    if total_names is not None:
+        jobs = max(min(jobs, total_names), 1)
+    result = BatchResult(jobs=jobs)
+    stats = result.stats
+
+    is_pdf = output.encoder.image_format == "PDF"
+    if output.archive and is_pdf:
+        raise ValueError("Archive output is only available for image formats")
+    if output.archive or (is_pdf and output.encoder.single_file):
+        # A single output file is either complete or not; there is nothing to resume
+        manifest = None
+    cache = RenderCache(on_disk=not output.archive) if reuse_duplicates and not is_pdf else None
+    fingerprint = batch_fingerprint(spec, output) if manifest is not None or cache is not None else None
+    skipped = [0]
+    items = _pending_items(_entries(spec, names), fingerprint, manifest, resume, skipped)
+    allocator = OutputAllocator(output, scan=not output.archive)
+    sink = None
+    if output.archive:
+        sink = open_archive_sink(output)
+        result.archive_path = sink.path
+
+    if is_pdf:
+        results = _render_pdf(spec, items, output, allocator, control, stats)
+    elif jobs > 1:
+        results = _render_parallel(spec, items, output, allocator, jobs, control, stats, cache)
+    else:
+        if renderer is None:
+            start = time.perf_counter()
+            renderer = CertificateRenderer(spec)
+            stats.add({"load": time.perf_counter() - start})
+        results = _render_serial(items, output, allocator, renderer, control, cache)
+
+    # Encoded certificates handed back by the render path are saved here
+    if sink is not None:
+        # One thread: an archive is a single stream
+        writer = BackgroundWriter(lambda item: sink.write(os.path.basename(item.path), item.data), threads=1)
+    else:
+        writer = BackgroundWriter(lambda item: _write_file(item.path, item.data, output.fsync))
+    done = [0]
+
+    def finish(item):
+        """Count a certificate once it is saved (or has failed)"""
+        if item.error is None:
+            result.success_count += 1
+            stats.bytes_written += item.size
+            if item.reused:
+                result.reused_count += 1
+            if manifest is not None:
+                start = time.perf_counter()
+                manifest.record(item.key, item.name, item.path)
+                _lap(item.timings, "manifest", start)
+        else:
+            result.failed_names.append(f"{item.name}: {item.error}")
+        stats.add(item.timings)
+
+        done[0] += 1
+        if progress:
+            count = done[0] + skipped[0]
+            progress(count, _progress_fraction(names, total_names, count))
+
+    try:
+        for item in results:
+            if item.error is None and not item.reused and cache is not None:
+                cache.add(item)
+            if item.data is not None:
+                writer.submit(item)
+            else:
+                finish(item)
+            for written in writer.finished():
+                finish(written)
+        for written in writer.drain():
+            finish(written)
+    finally:
+        # Queued certificates are still saved if rendering stopped early; record
+        # them too, or a resumed run would render them again under new names
+        for written in writer.drain():
+            if written.error is None and manifest is not None:
+                manifest.record(written.key, written.name, written.path)
+        writer.close()
+        if manifest is not None:
+            manifest.close()
+        if sink is not None:
+            sink.close()
+            if output.fsync:
+                _fsync_path(sink.path)
+
+    result.skipped_count = skipped[0]
+    stats.elapsed = time.perf_counter() - started
+    return result
@@ -0,0 +1,291 @@
+"""Benchmark the certificate pipeline on synthetic inputs.
+
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --compare before.json
+
+Each case generates a template (resolution and image mode) and a name
+list (lengths, scripts, duplicates), times the stages of the batch path
+one at a time (decode, convert, measure, draw, encode, write), then runs
+generate_certificates end to end. Results are written as JSON with
+per-stage percentiles in milliseconds, so runs can be diffed between
+versions. Every input is generated from a fixed seed, and unless --font
+is given the font is the TrueType face bundled with Pillow, so results
+from different machines measure the same glyphs.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import PIL
+from PIL import Image, ImageDraw, ImageFont
+
+import renderer as pipeline
+from batch import generate_certificates
+from encoders import PRESETS, encoder_preset
+from renderer import CertificateRenderer, OutputAllocator, OutputSpec, RenderSpec, file_digest, load_font
+from templatecache import CACHE_ENV, TemplateCache
+
+RESULTS_VERSION = 1
+STAGES = ("decode", "convert", "measure", "draw", "encode", "write")
+PERCENTILES = (50, 90, 99)
+# Template decodes timed per case; decoding is per batch (per worker), not per name
+DECODE_REPEATS = 5
+
+TEMPLATE_SIZES = {
+    "small": (1200, 850),
+    "a4-150dpi": (1754, 1240),
+    "a4-300dpi": (3508, 2480),
+}
+TEMPLATE_MODES = ("RGB", "RGBA", "P")
+
+SYLLABLES = {
+    "latin": ["an", "be", "ca", "do", "el", "fi", "gu", "ha", "is", "jo",
+              "ka", "li", "mo", "na", "or", "pe", "ri", "sa", "tu", "vi"],
+    "accented": ["á", "bé", "çi", "dö", "ñe", "ør", "lú", "ša", "žo", "ił"],
+    "greek": ["αλ", "βη", "γι", "δε", "κω", "λα", "μι", "νο", "πα", "σο"],
+    "cyrillic": ["ан", "бо", "ва", "ги", "да", "ел", "жу", "ки", "ло", "ми"],
+}
+NAME_SETS = ("latin-short", "latin-long", "mixed-scripts", "duplicates")
+# Share of names in the "duplicates" set that repeat an earlier name
+DUPLICATE_SHARE = 0.2
+
+
+def make_template(path, size, mode, seed=0):
+    """Write a decorated gradient template of the given size and mode as PNG"""
+    rng = random.Random(seed)
+    gradient = Image.linear_gradient("L")
+    red = gradient.resize(size)
+    green = gradient.rotate(90).resize(size)
+    blue = Image.new("L", size, 230)
+    img = Image.merge("RGB", (red, green, blue))
+
+    draw = ImageDraw.Draw(img)
+    width, height = size
+    border = max(width // 60, 2)
+    draw.rectangle((border, border, width - border, height - border), outline="#8b6f2f", width=border)
+    for _ in range(12):
+        x, y = rng.randrange(width), rng.randrange(height)
+        radius = rng.randrange(width // 40, width // 10)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), outline=color, width=border // 2 + 1)
+
+    if mode == "RGBA":
+        img.putalpha(255)
+    elif mode == "P":
+        img = img.quantize(64)
+    img.save(path, "PNG")
+    return path
+
+
+def _word(rng, script, syllables):
+    return "".join(rng.choice(SYLLABLES[script]) for _ in range(syllables)).capitalize()
+
+
+def make_names(kind, count, seed=0):
+    """Return a reproducible synthetic name list"""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        if kind == "duplicates" and names and rng.random() < DUPLICATE_SHARE:
+            names.append(rng.choice(names))
+            continue
+        script = rng.choice(list(SYLLABLES)) if kind == "mixed-scripts" else "latin"
+        parts = rng.randint(4, 6) if kind == "latin-long" else 2
+        names.append(" ".join(_word(rng, script, rng.randint(1, 3)) for _ in range(parts)))
+    return names
+
+
+def percentiles(samples):
+    """Summary statistics of timings (seconds) in milliseconds"""
+    ordered = sorted(samples)
+    stats = {"count": len(ordered)}
+    if not ordered:
+        return stats
+    for p in PERCENTILES:
+        # Nearest-rank percentile
+        index = max(math.ceil(p / 100 * len(ordered)) - 1, 0)
+        stats[f"p{p}"] = round(ordered[index] * 1000, 4)
+    stats["mean"] = round(sum(ordered) / len(ordered) * 1000, 4)
+    stats["max"] = round(ordered[-1] * 1000, 4)
+    return stats
+
+
+def time_stages(spec, names, output):
+    """Time each stage of the batch path separately; returns {stage: [seconds]}"""
+    timings = {stage: [] for stage in STAGES}
+    clock = time.perf_counter
+
+    for _ in range(DECODE_REPEATS):
+        start = clock()
+        with Image.open(spec.template_path) as img:
+            img.load()
+            decoded = clock()
+            template = img.convert("RGB")
+        timings["decode"].append(decoded - start)
+        timings["convert"].append(clock() - decoded)
+
+    renderer = CertificateRenderer(spec, template=template)
+    allocator = OutputAllocator(output)
+    for name in names:
+        start = clock()
+        renderer.layout(name)
+        measured = clock()
+        # render_incremental lays the name out again; that is part of "draw"
+        img = renderer.render_incremental(name)
+        drawn = clock()
+        data = renderer.encode(img, output)
+        encoded = clock()
+        with open(allocator.allocate(name), "wb") as f:
+            f.write(data)
+        written = clock()
+
+        timings["measure"].append(measured - start)
+        timings["draw"].append(drawn - measured)
+        timings["encode"].append(encoded - drawn)
+        timings["write"].append(written - encoded)
+    return timings
+
+
+def run_case(workdir, font_path, size_name, mode, names_kind, format_name, count, jobs):
+    """Benchmark one combination of template, names and output format"""
+    size = TEMPLATE_SIZES[size_name]
+    case_dir = tempfile.mkdtemp(dir=workdir)
+    template_path = make_template(os.path.join(case_dir, "template.png"), size, mode)
+    names = make_names(names_kind, count)
+    spec = RenderSpec(
+        template_path=template_path,
+        font_path=font_path,
+        font_size=max(size[1] // 12, 8),
+        color="#1a2b3c"
+    )
+    encoder = encoder_preset(format_name)
+
+    stage_output = OutputSpec(os.path.join(case_dir, "stages"), encoder=encoder)
+    os.makedirs(stage_output.output_dir)
+    timings = time_stages(spec, names, stage_output)
+
+    batch_output = OutputSpec(os.path.join(case_dir, "batch"), encoder=encoder)
+    os.makedirs(batch_output.output_dir)
+    start = time.perf_counter()
+    result = generate_certificates(spec, names, batch_output, jobs=jobs)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "id": f"{size_name}-{mode}-{names_kind}-{format_name}",
+        "template": {"size": list(size), "mode": mode},
+        "names": {"kind": names_kind, "count": count, "unique": len(set(names))},
+        "format": format_name,
+        "jobs": jobs,
+        "seconds": round(elapsed, 4),
+        "certificates_per_sec": round(result.success_count / elapsed, 2) if elapsed else None,
+        "failures": len(result.failed_names),
+        "stages": {stage: percentiles(samples) for stage, samples in timings.items()},
+    }
+
+
+def resolve_font(font_path, workdir):
+    """Font file to benchmark with: the given one, else Pillow's bundled face"""
+    if font_path:
+        return font_path
+    try:
+        # Pillow 10.1+ embeds a scalable font; write it out so RenderSpec can load it
+        data = ImageFont.load_default(size=12).font_bytes
+    except (TypeError, AttributeError, ImportError):
+        # Older Pillow or no FreeType: use whatever the renderer falls back to
+        path = getattr(load_font("", 12)[0], "path", None)
+        return path if isinstance(path, str) else ""
+    font_path = os.path.join(workdir, "bundled-font.ttf")
+    with open(font_path, "wb") as f:
+        f.write(data)
+    return font_path
+
+
+def environment(font_path):
+    return {
+        "python": platform.python_version(),
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "font": os.path.basename(font_path) if font_path else "pillow-default",
+        "font_sha256": file_digest(font_path) if font_path else None,
+    }
+
+
+def compare(results, baseline, stream):
+    """Print throughput and median stage changes against a baseline run"""
+    previous = {case["id"]: case for case in baseline.get("cases", [])}
+    for case in results["cases"]:
+        old = previous.get(case["id"])
+        if not old or not old.get("certificates_per_sec"):
+            stream.write(f"{case['id']}: no baseline\n")
+            continue
+        change = case["certificates_per_sec"] / old["certificates_per_sec"] - 1
+        stages = []
+        for stage in STAGES:
+            before = old["stages"].get(stage, {}).get("p50")
+            after = case["stages"][stage].get("p50")
+            if before and after is not None:
+                stages.append(f"{stage} {after / before - 1:+.0%}")
+        stream.write(f"{case['id']}: {change:+.1%} certificates/sec ({', '.join(stages)})\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark certificate generation on synthetic inputs.")
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="results JSON of an earlier run to compare with")
+    parser.add_argument("--font", default="", help="font file (default: the font bundled with Pillow)")
+    parser.add_argument("--count", type=int, default=200, help="names per case")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for the end-to-end run")
+    parser.add_argument("--sizes", nargs="+", default=list(TEMPLATE_SIZES), choices=list(TEMPLATE_SIZES))
+    parser.add_argument("--modes", nargs="+", default=list(TEMPLATE_MODES), choices=TEMPLATE_MODES)
+    parser.add_argument("--names", nargs="+", default=list(NAME_SETS), choices=NAME_SETS)
+    parser.add_argument("--formats", nargs="+", default=["png"],
+                        choices=sorted(name for name, spec in PRESETS.items() if spec.image_format != "PDF"))
+    parser.add_argument("--quick", action="store_true",
+                        help="one small RGB template with short names, for a fast sanity check")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.quick:
+        args.sizes, args.modes, args.names = ["small"], ["RGB"], ["latin-short"]
+
+    cases = []
+    with tempfile.TemporaryDirectory(prefix="certbench-") as workdir:
+        font_path = resolve_font(args.font, workdir)
+        # Keep cached templates out of the user's cache (workers read the environment)
+        os.environ[CACHE_ENV] = os.path.join(workdir, "template-cache")
+        pipeline.template_cache = TemplateCache.from_environment()
+        env = environment(font_path)
+        for size_name in args.sizes:
+            for mode in args.modes:
+                for names_kind in args.names:
+                    for format_name in args.formats:
+                        case = run_case(workdir, font_path, size_name, mode, names_kind,
+                                        format_name, args.count, args.jobs)
+                        sys.stderr.write(f"{case['id']}: {case['certificates_per_sec']} certificates/sec\n")
+                        cases.append(case)
+
+    results = {"version": RESULTS_VERSION, "environment": env, "cases": cases}
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f), sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""Command-line batch generation for scripted and scheduled runs.
+
+Usage::
+
+    python main.py render --template cert.png --font font.ttf \\
+        --names names.csv --out certificates --jobs 8
+
+Only Pillow is needed (plus reportlab for PDF output); Tkinter is never
+imported, so this works under cron, in containers and over SSH.
+"""
+import argparse
+import os
+import sys
+
+import renderer
+
+from batch import JobManifest, default_jobs, generate_certificates
+from encoders import PRESETS, encoder_preset
+from renderer import (
+    DEFAULT_FONT_SIZE,
+    FIELD_ALIGNMENTS,
+    OutputSpec,
+    RenderSpec,
+    TextField,
+    is_valid_color,
+    load_font,
+    validate_font_size,
+)
+from report import RunProfiler, build_report, report_path, summary_lines, write_report
+from sinks import ARCHIVE_EXTENSIONS
+from sources import NameSource
+from templatecache import CACHE_ENV
+
+# Failures listed in the summary before the rest are only counted
+MAX_LISTED_FAILURES = 20
+# Settings accepted in a --field value, and how to parse each
+FIELD_OPTIONS = {
+    "x": int,
+    "y": int,
+    "size": int,
+    "color": str,
+    "align": str,
+    "font": str,
+}
+
+
+def parse_field(value):
+    """Parse ``COLUMN:x=..,y=..[,size=..][,color=..][,align=..][,font=..]``"""
+    column, _, options = value.partition(":")
+    if not column or not options:
+        raise argparse.ArgumentTypeError("expected COLUMN:x=X,y=Y[,size=..,color=..,align=..,font=..]")
+    settings = {}
+    for option in options.split(","):
+        key, _, setting = option.partition("=")
+        key = key.strip()
+        if key not in FIELD_OPTIONS or not setting:
+            raise argparse.ArgumentTypeError(f"unknown field setting '{option}'")
+        try:
+            settings[key] = FIELD_OPTIONS[key](setting.strip())
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid value for {key}: '{setting}'")
+    if "x" not in settings or "y" not in settings:
+        raise argparse.ArgumentTypeError(f"field '{column}' needs x= and y=")
+
+    text_field = TextField(column, settings["x"], settings["y"])
+    text_field.font_path = settings.get("font", "")
+    text_field.font_size = settings.get("size", text_field.font_size)
+    text_field.color = settings.get("color", text_field.color)
+    text_field.align = settings.get("align", text_field.align)
+    return text_field
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Generate certificates without the GUI. Run with no arguments to open the app."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render = commands.add_parser("render", help="generate one certificate per name")
+    render.add_argument("--template", required=True, help="certificate template image (PNG or JPG)")
+    render.add_argument("--font", default="", help="TrueType/OpenType font file (default: a system font)")
+    render.add_argument("--names", required=True, help="names file: CSV, TSV, JSONL or one name per line")
+    render.add_argument("--name-field", help="CSV/TSV column or JSONL key holding the name")
+    render.add_argument("--out", required=True, help="output folder (created if missing)")
+    render.add_argument("--jobs", type=int, default=default_jobs(),
+                        help="worker processes (default: one per CPU core)")
+    render.add_argument("--size", type=int, default=DEFAULT_FONT_SIZE,
+                        help="font size, or the largest size with --fit-width/--fit-height")
+    render.add_argument("--color", default="black", help="text color as #RRGGBB or a color name")
+    render.add_argument("--x", type=int, help="text center X in template pixels (default: centered)")
+    render.add_argument("--y", type=int, help="text center Y in template pixels (default: centered)")
+    render.add_argument("--fit-width", type=int, default=0, help="shrink names to fit a box this wide")
+    render.add_argument("--fit-height", type=int, default=0, help="shrink names to fit a box this tall")
+    render.add_argument("--field", dest="fields", action="append", default=[], type=parse_field,
+                        metavar="COLUMN:x=X,y=Y[,size=N,color=C,align=left|center|right,font=PATH]",
+                        help="also draw this column of the names file at (x, y); repeatable")
+    render.add_argument("--format", default="png", choices=sorted(PRESETS), help="output format preset")
+    render.add_argument("--archive", default="", choices=sorted(ARCHIVE_EXTENSIONS),
+                        help="write a single ZIP or TAR archive instead of loose files")
+    render.add_argument("--prefix", default="certificate_", help="output filename prefix")
+    render.add_argument("--fsync", action="store_true",
+                        help="flush every certificate to disk before counting it as done (slower)")
+    render.add_argument("--resume", action="store_true",
+                        help="skip certificates already produced by an earlier run into --out "
+                             "(loose files only: not with --archive or --format pdf)")
+    render.add_argument("--quiet", action="store_true", help="don't report progress")
+    render.add_argument("--no-template-cache", action="store_true",
+                        help="decode the template afresh instead of using the on-disk template cache")
+    render.add_argument("--no-report", action="store_true",
+                        help="don't write a certificates_report_*.json run report into --out")
+    render.add_argument("--profile", action="store_true",
+                        help="profile this process with cProfile (saved next to the report)")
+    render.add_argument("--trace-memory", action="store_true",
+                        help="record peak memory and top allocation sites with tracemalloc")
+    return parser
+
+
+def build_render_spec(args):
+    """Validate the render options into a RenderSpec, raising ValueError"""
+    if not os.path.isfile(args.template):
+        raise ValueError(f"Template not found: {args.template}")
+    if args.font and not os.path.isfile(args.font):
+        raise ValueError(f"Font not found: {args.font}")
+    try:
+        font_size = validate_font_size(args.size)
+    except ValueError:
+        raise ValueError("Font size must be a number between 1 and 500")
+    if not is_valid_color(args.color):
+        raise ValueError(f"Invalid color '{args.color}'")
+    if (args.x is None) != (args.y is None):
+        raise ValueError("--x and --y must be given together")
+    if args.fit_width < 0 or args.fit_height < 0:
+        raise ValueError("--fit-width and --fit-height can't be negative")
+    for text_field in args.fields:
+        if text_field.font_path and not os.path.isfile(text_field.font_path):
+            raise ValueError(f"Font not found: {text_field.font_path}")
+        try:
+            validate_font_size(text_field.font_size)
+        except ValueError:
+            raise ValueError(f"Font size of field '{text_field.column}' must be between 1 and 500")
+        if not is_valid_color(text_field.color):
+            raise ValueError(f"Invalid color '{text_field.color}' for field '{text_field.column}'")
+        if text_field.align not in FIELD_ALIGNMENTS:
+            raise ValueError(f"Field alignment must be one of {', '.join(FIELD_ALIGNMENTS)}")
+
+    spec = RenderSpec(
+        template_path=args.template,
+        font_path=args.font,
+        font_size=font_size,
+        color=args.color,
+        fit_width=args.fit_width,
+        fit_height=args.fit_height,
+        fields=args.fields
+    )
+    if args.x is not None:
+        spec.position_mode = "custom"
+        spec.x, spec.y = args.x, args.y
+    return spec
+
+
+def progress_printer(stream):
+    """Progress callback that rewrites one status line on a terminal"""
+    last = [-1]
+
+    def on_progress(done, fraction):
+        percent = int(fraction * 100)
+        if percent != last[0]:
+            last[0] = percent
+            stream.write(f"\r{done} certificates ({percent}%)")
+            stream.flush()
+
+    return on_progress
+
+
+def render(args):
+    """Run the ``render`` command; returns the process exit code"""
+    try:
+        spec = build_render_spec(args)
+        output = OutputSpec(args.out, prefix=args.prefix, encoder=encoder_preset(args.format),
+                            archive=args.archive, fsync=args.fsync)
+        if output.archive and output.encoder.image_format == "PDF":
+            raise ValueError("--archive can only be used with image formats, not PDF")
+        # A single output file is rewritten whole, so there is nothing to resume
+        if args.resume and output.archive:
+            raise ValueError("--resume can't be used with --archive")
+        if args.resume and output.encoder.image_format == "PDF" and output.encoder.single_file:
+            raise ValueError("--resume needs one file per name; use --format pdf-per-name")
+        names = NameSource(args.names, name_field=args.name_field)
+        os.makedirs(args.out, exist_ok=True)
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if load_font(spec.font_path, spec.font_size)[1]:
+        print("warning: no TrueType font found, using Pillow's default font", file=sys.stderr)
+    jobs = max(args.jobs, 1)
+    if args.no_template_cache:
+        # Worker processes read the setting from the environment
+        os.environ[CACHE_ENV] = "off"
+        renderer.template_cache = None
+    show_progress = not args.quiet and sys.stderr.isatty()
+
+    profiler = RunProfiler(cpu=args.profile, memory=args.trace_memory)
+    try:
+        with profiler:
+            result = generate_certificates(
+                spec,
+                names,
+                output,
+                jobs=jobs,
+                progress=progress_printer(sys.stderr) if show_progress else None,
+                manifest=JobManifest.for_output(output),
+                resume=args.resume
+            )
+    except KeyboardInterrupt:
+        print("\ninterrupted", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"\nerror: {e}", file=sys.stderr)
+        return 1
+    if show_progress:
+        sys.stderr.write("\n")
+
+    path = report_path(output.output_dir)
+    profile = None
+    if args.profile or args.trace_memory:
+        profile = profiler.results(os.path.splitext(path)[0] + ".prof")
+    report = build_report(result, output, profile=profile)
+    for line in summary_lines(report):
+        print(line)
+    print(f"Output: {report['output']}")
+    if not args.no_report or profile:
+        try:
+            print(f"Report: {write_report(report, path)}")
+        except OSError as e:
+            print(f"warning: couldn't write the run report: {e}", file=sys.stderr)
+
+    if result.failed_names:
+        print(f"{len(result.failed_names)} failed:", file=sys.stderr)
+        for failure in result.failed_names[:MAX_LISTED_FAILURES]:
+            print(f"  {failure}", file=sys.stderr)
+        if len(result.failed_names) > MAX_LISTED_FAILURES:
+            print(f"  ...and {len(result.failed_names) - MAX_LISTED_FAILURES} more", file=sys.stderr)
+        return 1
+    return 0
+
+
+COMMANDS = {
+    "render": render,
+}
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
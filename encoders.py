@@ -0,0 +1,111 @@
+"""Output encoders: image format and compression settings for certificates.
+
+Encoding is usually the most expensive step per certificate, so the
+format and its speed/size trade-off are configurable through EncoderSpec
+and a handful of named presets.
+"""
+import zlib
+from dataclasses import dataclass, replace
+
+from PIL import Image
+
+EXTENSIONS = {
+    "PNG": ".png",
+    "JPEG": ".jpg",
+    "WEBP": ".webp",
+    "PDF": ".pdf",
+}
+
+
+@dataclass
+class EncoderSpec:
+    """How rendered certificates are encoded"""
+    image_format: str = "PNG"
+    # PNG: zlib level 0 (store) to 9 (smallest, slowest)
+    compress_level: int = 6
+    # PNG: extra pass to find the smallest encoding (slow)
+    optimize: bool = False
+    # PNG: zlib strategy; Z_FILTERED suits photographic templates, Z_RLE is
+    # much faster than the default at compress_level 6+ for slightly larger files
+    compress_type: int = zlib.Z_DEFAULT_STRATEGY
+    # PNG: quantize to this many palette colors when > 0 (good for flat templates)
+    palette_colors: int = 0
+    # JPEG / lossy WebP quality, 1-100
+    quality: int = 90
+    # JPEG chroma subsampling: "4:4:4" keeps colored text crisp, "4:2:0" is smaller
+    subsampling: str = "4:4:4"
+    # WebP
+    lossless: bool = False
+    method: int = 4  # 0 (fast) to 6 (smallest)
+    # PDF: one document with a page per name, or one document per name
+    single_file: bool = True
+    # PDF: template resolution used for the page size; 0 uses the image's own (or 72)
+    dpi: float = 0
+
+    @property
+    def extension(self):
+        return EXTENSIONS[self.image_format]
+
+
+# Formats Pillow encodes straight from an RGBX image, such as a mapped
+# template; PNG needs a true RGB image
+RGBX_FORMATS = ("JPEG", "WEBP")
+
+PRESETS = {
+    "png": EncoderSpec(),
+    "png-fast": EncoderSpec(compress_level=1),
+    "png-compact": EncoderSpec(compress_level=9, optimize=True, compress_type=zlib.Z_FILTERED),
+    # At level 1 Z_RLE is no faster than the default strategy, so png-fast keeps it
+    "png-rle": EncoderSpec(compress_level=6, compress_type=zlib.Z_RLE),
+    "png-palette": EncoderSpec(compress_level=9, palette_colors=256),
+    "jpeg": EncoderSpec(image_format="JPEG", quality=90),
+    "jpeg-compact": EncoderSpec(image_format="JPEG", quality=80, subsampling="4:2:0"),
+    "webp": EncoderSpec(image_format="WEBP", quality=85),
+    "webp-lossless": EncoderSpec(image_format="WEBP", lossless=True, method=2),
+    "pdf": EncoderSpec(image_format="PDF"),
+    "pdf-per-name": EncoderSpec(image_format="PDF", single_file=False),
+}
+
+
+def encoder_preset(name, **overrides):
+    """Return a copy of a named preset, optionally with fields overridden"""
+    try:
+        preset = PRESETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown output format '{name}'")
+    return replace(preset, **overrides)
+
+
+def save_options(encoder):
+    """Keyword arguments for Image.save for this encoder"""
+    if encoder.image_format == "PNG":
+        return {
+            "compress_level": encoder.compress_level,
+            "optimize": encoder.optimize,
+            "compress_type": encoder.compress_type,
+        }
+    if encoder.image_format == "JPEG":
+        return {"quality": encoder.quality, "subsampling": encoder.subsampling}
+    if encoder.image_format == "WEBP":
+        return {"quality": encoder.quality, "lossless": encoder.lossless, "method": encoder.method}
+    if encoder.image_format == "PDF":
+        raise ValueError("PDF certificates are written by pdfoutput.PdfCertificateWriter")
+    raise ValueError(f"Unsupported output format '{encoder.image_format}'")
+
+
+def prepare_image(img, encoder):
+    """Convert a rendered image into something the encoder accepts"""
+    if encoder.image_format == "PNG" and encoder.palette_colors:
+        return img.quantize(
+            colors=encoder.palette_colors,
+            method=Image.Quantize.FASTOCTREE,
+            dither=Image.Dither.NONE
+        )
+    if encoder.image_format == "JPEG" and img.mode not in ("RGB", "RGBX", "L"):
+        return img.convert("RGB")
+    return img
+
+
+def encode_image(img, fp, encoder):
+    """Encode a rendered certificate to a path or file object"""
+    prepare_image(img, encoder).save(fp, encoder.image_format, **save_options(encoder))
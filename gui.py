@@ -0,0 +1,1436 @@
+"""Tkinter desktop app; imported by main.py only when the GUI is launched"""
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk, colorchooser
+from PIL import Image, ImageDraw, ImageTk, ImageFont
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import replace
+
+from batch import BatchControl, JobManifest, default_jobs, generate_certificates
+from encoders import encoder_preset
+from report import build_report, report_path, summary_lines, write_report
+from sources import NameSource
+from renderer import (
+    DEFAULT_FONT_SIZE,
+    FIELD_ALIGNMENTS,
+    CertificateRenderer,
+    OutputSpec,
+    PositionError,
+    RenderSpec,
+    TextField,
+    is_valid_color,
+    load_font,
+    load_template_pyramid,
+    validate_font_size,
+)
+
+# Output format choices shown in the UI, mapped to encoder presets
+OUTPUT_FORMATS = [
+    ("PNG (balanced)", "png"),
+    ("PNG (fast, larger files)", "png-fast"),
+    ("PNG (RLE, faster encode)", "png-rle"),
+    ("PNG (compact, slower)", "png-compact"),
+    ("PNG (palette, for flat templates)", "png-palette"),
+    ("JPEG", "jpeg"),
+    ("JPEG (compact for email)", "jpeg-compact"),
+    ("WebP", "webp"),
+    ("WebP (lossless)", "webp-lossless"),
+    ("PDF (one file, page per name)", "pdf"),
+    ("PDF (one file per name)", "pdf-per-name"),
+]
+
+# How certificates are stored: loose files or streamed into one archive
+ARCHIVE_CHOICES = [
+    ("Separate files", ""),
+    ("ZIP archive", "zip"),
+    ("TAR archive", "tar"),
+]
+
+# Minimum time between progress bar refreshes during a batch
+PROGRESS_INTERVAL_MS = 100
+# Wait for the zoom slider to settle before redrawing the preview
+ZOOM_DEBOUNCE_MS = 60
+# Smallest zoom level on the slider, which bounds the preview pyramid
+MIN_ZOOM = 25
+# Drags shorter than this (in template pixels) are plain clicks, not a text box
+MIN_BOX_DRAG = 10
+
+
+class CertificateGenerator:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Certificate Generator Pro")
+        self.root.geometry("800x800")
+        self.root.configure(bg="#e6ecf0")
+        
+        # Variables
+        self.cert_image_path = tk.StringVar()
+        self.font_path_var = tk.StringVar()
+        self.names_file_var = tk.StringVar()
+        self.resume_var = tk.BooleanVar(value=False)
+        self.output_format_var = tk.StringVar(value=OUTPUT_FORMATS[0][0])
+        self.archive_var = tk.StringVar(value=ARCHIVE_CHOICES[0][0])
+        self.preview_img = None
+        self.original_img = None
+        self.preview_pyramid = None
+        self.preview_base = None  # Template scaled to the current zoom
+        self.zoom_after_id = None
+        self.base_preview_size = (600, 400)  # Base size for 100% zoom
+        self.zoom_level = tk.DoubleVar(value=100.0)  # Default 100%
+        self.default_font_size = DEFAULT_FONT_SIZE
+        self.cursor_pos_var = tk.StringVar(value="X: 0, Y: 0")
+        self.fit_var = tk.BooleanVar(value=False)
+        self.drag_start = None
+        # Extra TextFields and the settings of the one being edited
+        self.extra_fields = []
+        self.field_font_var = tk.StringVar()
+        self.field_align_var = tk.StringVar(value="center")
+        self.place_target_var = tk.StringVar(value="name")  # What a preview click places
+        self.font_color_var = tk.StringVar(value="black")  # Default color
+        self.hex_color_var = tk.StringVar(value="#000000")  # Default hex color (black)
+        
+        # Background batch state
+        self.batch_thread = None
+        self.batch_control = None
+        self.batch_queue = queue.Queue()
+        self.batch_output = None
+        
+        self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def setup_ui(self):
+        # Main canvas for scrolling
+        main_canvas = tk.Canvas(self.root, bg="#e6ecf0", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
+        main_frame = ttk.Frame(main_canvas)
+        
+        main_frame.bind(
+            "<Configure>",
+            lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all"))
+        )
+        
+        main_canvas.create_window((0, 0), window=main_frame, anchor="nw")
+        main_canvas.configure(yscrollcommand=scrollbar.set)
+        
+        main_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Enable mouse wheel scrolling
+        def _on_mousewheel(event):
+            main_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        
+        main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        main_canvas.bind_all("<Button-4>", lambda e: main_canvas.yview_scroll(-1, "units"))
+        main_canvas.bind_all("<Button-5>", lambda e: main_canvas.yview_scroll(1, "units"))
+        
+        # Title
+        ttk.Label(
+            main_frame,
+            text="📜 Certificate Generator Pro",
+            style="Title.TLabel"
+        ).pack(pady=(0, 20))
+        
+        # Style configuration
+        style = ttk.Style()
+        style.configure("Title.TLabel", font=("Helvetica", 22, "bold"), foreground="#2c3e50")
+        style.configure("Section.TLabel", font=("Helvetica", 14, "bold"), foreground="#2c3e50")
+        style.configure("TButton", font=("Helvetica", 10, "bold"))
+        style.configure("TLabel", font=("Helvetica", 10), background="#e6ecf0")
+        
+        # Certificate Image Section
+        self.create_section(main_frame, "1. Select Certificate Template")
+        img_frame = ttk.Frame(main_frame)
+        img_frame.pack(fill=tk.X, pady=5)
+        
+        self.img_entry = ttk.Entry(
+            img_frame,
+            textvariable=self.cert_image_path,
+            width=50,
+            state="readonly"
+        )
+        self.img_entry.pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(
+            img_frame,
+            text="Browse Image",
+            command=self.select_image,
+            style="TButton"
+        ).pack(side=tk.LEFT)
+        
+        # Preview Section
+        preview_frame = ttk.LabelFrame(
+            main_frame,
+            text="Preview (Click to Set Position)",
+            padding=10
+        )
+        preview_frame.pack(fill=tk.BOTH, pady=15)
+        
+        # Zoom control
+        zoom_frame = ttk.Frame(preview_frame)
+        zoom_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(zoom_frame, text="Zoom:").pack(side=tk.LEFT, padx=5)
+        ttk.Scale(
+            zoom_frame,
+            from_=MIN_ZOOM,
+            to=200,
+            orient=tk.HORIZONTAL,
+            variable=self.zoom_level,
+            command=self.schedule_zoom
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        ttk.Label(
+            zoom_frame,
+            textvariable=self.zoom_level,
+            text="100.0%"
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Label(zoom_frame, text="%").pack(side=tk.LEFT)
+        
+        # Scrollable preview
+        self.canvas = tk.Canvas(preview_frame, bg="white", highlightthickness=0)
+        preview_scrollbar = ttk.Scrollbar(preview_frame, orient="vertical", command=self.canvas.yview)
+        self.scrollable_frame = ttk.Frame(self.canvas)
+        
+        self.scrollable_frame.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
+        
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=preview_scrollbar.set)
+        
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        preview_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.image_label = ttk.Label(
+            self.scrollable_frame,
+            text="📷 No image loaded\n\nClick 'Browse Image' to get started",
+            foreground="#95a5a6",
+            font=("Helvetica", 12),
+            justify="center"
+        )
+        self.image_label.pack(padx=10, pady=10)
+        
+        # Cursor position display
+        ttk.Label(
+            preview_frame,
+            textvariable=self.cursor_pos_var,
+            font=("Helvetica", 9, "italic"),
+            foreground="#7f8c8d"
+        ).pack(anchor=tk.W, padx=10)
+        
+        # Position Settings Section
+        self.create_section(main_frame, "2. Text Position")
+        position_frame = ttk.Frame(main_frame)
+        position_frame.pack(fill=tk.X, pady=5)
+        
+        self.position_mode = tk.StringVar(value="center")
+        
+        ttk.Radiobutton(
+            position_frame,
+            text="Center (Default)",
+            variable=self.position_mode,
+            value="center",
+            command=self.toggle_position_inputs
+        ).grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
+        
+        ttk.Radiobutton(
+            position_frame,
+            text="Custom Position",
+            variable=self.position_mode,
+            value="custom",
+            command=self.toggle_position_inputs
+        ).grid(row=0, column=1, sticky=tk.W, padx=10, pady=5)
+        
+        custom_pos_frame = ttk.Frame(position_frame)
+        custom_pos_frame.grid(row=1, column=0, columnspan=3, sticky=tk.W, padx=30, pady=5)
+        
+        ttk.Label(
+            custom_pos_frame,
+            text="X Position:"
+        ).grid(row=0, column=0, sticky=tk.W, padx=5)
+        
+        self.x_position_entry = ttk.Entry(custom_pos_frame, width=10)
+        self.x_position_entry.grid(row=0, column=1, padx=5)
+        self.x_position_entry.insert(0, "0")
+        self.x_position_entry.config(state="disabled")
+        
+        ttk.Label(
+            custom_pos_frame,
+            text="Y Position:"
+        ).grid(row=0, column=2, sticky=tk.W, padx=(20, 5))
+        
+        self.y_position_entry = ttk.Entry(custom_pos_frame, width=10)
+        self.y_position_entry.grid(row=0, column=3, padx=5)
+        self.y_position_entry.insert(0, "0")
+        self.y_position_entry.config(state="disabled")
+        
+        ttk.Label(
+            custom_pos_frame,
+            text="(in pixels from top-left corner, or click on preview)",
+            font=("Helvetica", 8, "italic"),
+            foreground="#7f8c8d"
+        ).grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(2, 0))
+        
+        fit_frame = ttk.Frame(position_frame)
+        fit_frame.grid(row=2, column=0, columnspan=3, sticky=tk.W, padx=10, pady=5)
+        
+        ttk.Checkbutton(
+            fit_frame,
+            text="Shrink names to fit a text box",
+            variable=self.fit_var,
+            command=self.toggle_fit_inputs
+        ).grid(row=0, column=0, columnspan=4, sticky=tk.W)
+        
+        ttk.Label(fit_frame, text="Box Width:").grid(row=1, column=0, sticky=tk.W, padx=(20, 5))
+        
+        self.fit_width_entry = ttk.Entry(fit_frame, width=10)
+        self.fit_width_entry.grid(row=1, column=1, padx=5)
+        self.fit_width_entry.insert(0, "0")
+        self.fit_width_entry.config(state="disabled")
+        
+        ttk.Label(fit_frame, text="Box Height:").grid(row=1, column=2, sticky=tk.W, padx=(20, 5))
+        
+        self.fit_height_entry = ttk.Entry(fit_frame, width=10)
+        self.fit_height_entry.grid(row=1, column=3, padx=5)
+        self.fit_height_entry.insert(0, "0")
+        self.fit_height_entry.config(state="disabled")
+        
+        ttk.Label(
+            fit_frame,
+            text="(centered on the text position; with Custom Position, drag on the preview)",
+            font=("Helvetica", 8, "italic"),
+            foreground="#7f8c8d"
+        ).grid(row=2, column=0, columnspan=4, sticky=tk.W, padx=(20, 0), pady=(2, 0))
+        
+        # Font Settings Section
+        self.create_section(main_frame, "3. Font Settings")
+        font_frame = ttk.Frame(main_frame)
+        font_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Label(font_frame, text="Font File:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        
+        self.font_entry = ttk.Entry(
+            font_frame,
+            textvariable=self.font_path_var,
+            width=40,
+            state="readonly"
+        )
+        self.font_entry.grid(row=0, column=1, padx=10)
+        
+        ttk.Button(
+            font_frame,
+            text="Select Font",
+            command=self.select_font
+        ).grid(row=0, column=2)
+        
+        ttk.Label(font_frame, text="Font Size:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        
+        self.font_size_entry = ttk.Spinbox(
+            font_frame,
+            from_=10,
+            to=200,
+            width=10
+        )
+        self.font_size_entry.delete(0, tk.END)
+        self.font_size_entry.insert(0, str(self.default_font_size))
+        self.font_size_entry.grid(row=1, column=1, sticky=tk.W, padx=10)
+        
+        ttk.Label(font_frame, text="Font Color:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        
+        color_frame = ttk.Frame(font_frame)
+        color_frame.grid(row=2, column=1, sticky=tk.W, padx=10)
+        
+        # Predefined color options
+        colors = [("Black", "black"), ("Blue", "#1a5490"), ("Gold", "#d4af37"), ("Red", "#c0392b")]
+        for col, (text, color) in enumerate(colors):
+            ttk.Radiobutton(
+                color_frame,
+                text=text,
+                variable=self.font_color_var,
+                value=color,
+                command=self.update_hex_from_radio
+            ).grid(row=0, column=col, sticky=tk.W, padx=5)
+        
+        # Custom color option
+        ttk.Radiobutton(
+            color_frame,
+            text="Custom",
+            variable=self.font_color_var,
+            value="custom",
+            command=self.update_from_hex_entry
+        ).grid(row=0, column=len(colors), sticky=tk.W, padx=5)
+        
+        # Hex color entry
+        self.hex_color_entry = ttk.Entry(
+            color_frame,
+            textvariable=self.hex_color_var,
+            width=10
+        )
+        self.hex_color_entry.grid(row=0, column=len(colors) + 1, padx=5)
+        self.hex_color_entry.bind("<KeyRelease>", self.validate_hex_color)
+        
+        # Color wheel button
+        ttk.Button(
+            color_frame,
+            text="🎨 Pick Color",
+            command=self.open_color_chooser
+        ).grid(row=0, column=len(colors) + 2, padx=5)
+        
+        # Preview Text Section
+        self.create_section(main_frame, "4. Preview Text")
+        ttk.Label(
+            main_frame,
+            text="Preview Name (for positioning):",
+            font=("Helvetica", 9, "italic"),
+            foreground="#7f8c8d"
+        ).pack(anchor=tk.W)
+        
+        self.preview_text_var = tk.StringVar(value="Sample Name")
+        ttk.Entry(
+            main_frame,
+            textvariable=self.preview_text_var,
+            width=70
+        ).pack(pady=5)
+        
+        ttk.Button(
+            main_frame,
+            text="Preview Text on Certificate",
+            command=self.preview_text,
+            style="TButton"
+        ).pack(pady=5)
+        
+        ttk.Button(
+            main_frame,
+            text="🔍 Proof at Full Resolution",
+            command=lambda: self.preview_text(exact=True),
+            style="TButton"
+        ).pack(pady=5)
+        
+        # Extra Fields Section
+        self.create_section(main_frame, "5. Extra Fields")
+        ttk.Label(
+            main_frame,
+            text="Also draw other columns of the names file (course, date, ID...) on each certificate:",
+            font=("Helvetica", 9, "italic"),
+            foreground="#7f8c8d"
+        ).pack(anchor=tk.W)
+        
+        self.fields_tree = ttk.Treeview(
+            main_frame,
+            columns=("column", "position", "size", "color", "align", "font"),
+            show="headings",
+            height=4,
+            selectmode="browse"
+        )
+        for column, heading, width in (
+            ("column", "Column", 120),
+            ("position", "X, Y", 90),
+            ("size", "Size", 50),
+            ("color", "Color", 70),
+            ("align", "Align", 60),
+            ("font", "Font", 140)
+        ):
+            self.fields_tree.heading(column, text=heading)
+            self.fields_tree.column(column, width=width)
+        self.fields_tree.pack(fill=tk.X, pady=5)
+        self.fields_tree.bind("<<TreeviewSelect>>", self.load_selected_field)
+        
+        field_frame = ttk.Frame(main_frame)
+        field_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(field_frame, text="Column:").grid(row=0, column=0, sticky=tk.W, pady=2)
+        self.field_column_entry = ttk.Entry(field_frame, width=16)
+        self.field_column_entry.grid(row=0, column=1, sticky=tk.W, padx=5)
+        
+        ttk.Label(field_frame, text="Size:").grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
+        self.field_size_entry = ttk.Spinbox(field_frame, from_=10, to=200, width=6)
+        self.field_size_entry.insert(0, "36")
+        self.field_size_entry.grid(row=0, column=3, sticky=tk.W, padx=5)
+        
+        ttk.Label(field_frame, text="Color:").grid(row=0, column=4, sticky=tk.W, padx=(10, 0))
+        self.field_color_entry = ttk.Entry(field_frame, width=10)
+        self.field_color_entry.insert(0, "black")
+        self.field_color_entry.grid(row=0, column=5, sticky=tk.W, padx=5)
+        
+        ttk.Label(field_frame, text="Align:").grid(row=0, column=6, sticky=tk.W, padx=(10, 0))
+        ttk.Combobox(
+            field_frame,
+            textvariable=self.field_align_var,
+            values=FIELD_ALIGNMENTS,
+            state="readonly",
+            width=8
+        ).grid(row=0, column=7, sticky=tk.W, padx=5)
+        
+        ttk.Label(field_frame, text="Font:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(
+            field_frame,
+            textvariable=self.field_font_var,
+            width=30,
+            state="readonly"
+        ).grid(row=1, column=1, columnspan=4, sticky=tk.W, padx=5)
+        ttk.Button(
+            field_frame,
+            text="Select Font",
+            command=self.select_field_font
+        ).grid(row=1, column=5, columnspan=2, sticky=tk.W)
+        ttk.Button(
+            field_frame,
+            text="Use Main Font",
+            command=lambda: self.field_font_var.set("")
+        ).grid(row=1, column=7, sticky=tk.W)
+        
+        field_buttons = ttk.Frame(main_frame)
+        field_buttons.pack(anchor=tk.W, pady=5)
+        ttk.Button(field_buttons, text="Add Field", command=self.add_field).pack(side=tk.LEFT)
+        ttk.Button(field_buttons, text="Update Field", command=self.update_field).pack(side=tk.LEFT, padx=5)
+        ttk.Button(field_buttons, text="Remove Field", command=self.remove_field).pack(side=tk.LEFT)
+        
+        place_frame = ttk.Frame(main_frame)
+        place_frame.pack(anchor=tk.W, pady=5)
+        ttk.Label(place_frame, text="Clicking the preview places:").pack(side=tk.LEFT)
+        ttk.Radiobutton(
+            place_frame,
+            text="Name",
+            variable=self.place_target_var,
+            value="name",
+            command=self.update_click_bindings
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(
+            place_frame,
+            text="Selected field",
+            variable=self.place_target_var,
+            value="field",
+            command=self.update_click_bindings
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Names Section
+        self.create_section(main_frame, "6. Enter Names")
+        ttk.Label(
+            main_frame,
+            text="Enter one name per line, or load them from a CSV/TSV/JSONL/text file:",
+            font=("Helvetica", 9, "italic"),
+            foreground="#7f8c8d"
+        ).pack(anchor=tk.W)
+        
+        names_file_frame = ttk.Frame(main_frame)
+        names_file_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Entry(
+            names_file_frame,
+            textvariable=self.names_file_var,
+            width=50,
+            state="readonly"
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(
+            names_file_frame,
+            text="Load Names File",
+            command=self.select_names_file
+        ).pack(side=tk.LEFT)
+        
+        ttk.Button(
+            names_file_frame,
+            text="Clear",
+            command=lambda: self.names_file_var.set("")
+        ).pack(side=tk.LEFT, padx=5)
+        
+        self.names_entry = tk.Text(
+            main_frame,
+            height=6,
+            width=70,
+            font=("Helvetica", 11),
+            relief="flat",
+            bd=1,
+            background="white"
+        )
+        self.names_entry.pack(pady=5)
+        
+        # Worker processes
+        jobs_frame = ttk.Frame(main_frame)
+        jobs_frame.pack(anchor=tk.W, pady=5)
+        ttk.Label(jobs_frame, text="Worker Processes:").pack(side=tk.LEFT)
+        self.jobs_entry = ttk.Spinbox(
+            jobs_frame,
+            from_=1,
+            to=max(default_jobs(), 1),
+            width=5
+        )
+        self.jobs_entry.delete(0, tk.END)
+        self.jobs_entry.insert(0, str(default_jobs()))
+        self.jobs_entry.pack(side=tk.LEFT, padx=10)
+        ttk.Label(
+            jobs_frame,
+            text="(1 renders in this window; more uses all CPU cores)",
+            font=("Helvetica", 8, "italic"),
+            foreground="#7f8c8d"
+        ).pack(side=tk.LEFT)
+        
+        # Output format
+        format_frame = ttk.Frame(main_frame)
+        format_frame.pack(anchor=tk.W, pady=5)
+        ttk.Label(format_frame, text="Output Format:").pack(side=tk.LEFT)
+        ttk.Combobox(
+            format_frame,
+            textvariable=self.output_format_var,
+            values=[label for label, _ in OUTPUT_FORMATS],
+            state="readonly",
+            width=32
+        ).pack(side=tk.LEFT, padx=10)
+        ttk.Label(format_frame, text="Save As:").pack(side=tk.LEFT)
+        ttk.Combobox(
+            format_frame,
+            textvariable=self.archive_var,
+            values=[label for label, _ in ARCHIVE_CHOICES],
+            state="readonly",
+            width=14
+        ).pack(side=tk.LEFT, padx=10)
+        
+        ttk.Checkbutton(
+            main_frame,
+            text="Resume previous run (skip certificates already generated in the chosen folder)",
+            variable=self.resume_var
+        ).pack(anchor=tk.W, pady=5)
+        
+        # Progress Bar
+        self.progress_var = tk.DoubleVar()
+        self.progress_bar = ttk.Progressbar(
+            main_frame,
+            variable=self.progress_var,
+            maximum=100,
+            length=400
+        )
+        self.progress_bar.pack(pady=10)
+        
+        # Action Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(pady=20)
+        
+        self.generate_button = ttk.Button(
+            button_frame,
+            text="🎓 Generate Certificates",
+            command=self.generate_certificates,
+            style="TButton"
+        )
+        self.generate_button.pack(side=tk.LEFT, padx=10)
+        
+        self.pause_button = ttk.Button(
+            button_frame,
+            text="Pause",
+            command=self.toggle_pause,
+            style="TButton",
+            state="disabled"
+        )
+        self.pause_button.pack(side=tk.LEFT, padx=10)
+        
+        self.cancel_button = ttk.Button(
+            button_frame,
+            text="Cancel",
+            command=self.cancel_batch,
+            style="TButton",
+            state="disabled"
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=10)
+        
+        self.reset_button = ttk.Button(
+            button_frame,
+            text="Reset All",
+            command=self.reset_form,
+            style="TButton"
+        )
+        self.reset_button.pack(side=tk.LEFT, padx=10)
+        
+        # Footer
+        ttk.Label(
+            main_frame,
+            text="Made with ❤️ | v2.3 | Zoomable Preview",
+            font=("Helvetica", 8),
+            foreground="#95a5a6"
+        ).pack(side=tk.BOTTOM, pady=10)
+    
+    def create_section(self, parent, title):
+        """Create a section header"""
+        ttk.Label(
+            parent,
+            text=title,
+            style="Section.TLabel"
+        ).pack(anchor=tk.W, pady=(15, 5))
+    
+    def toggle_position_inputs(self):
+        """Enable/disable position input fields based on selection"""
+        state = "normal" if self.position_mode.get() == "custom" else "disabled"
+        self.x_position_entry.config(state=state)
+        self.y_position_entry.config(state=state)
+        self.update_click_bindings()
+        self.update_preview(None)  # Refresh preview to reflect position mode
+    
+    def update_click_bindings(self):
+        """Listen for clicks on the preview while there is something to place"""
+        if self.position_mode.get() == "custom" or self.place_target_var.get() == "field":
+            self.image_label.bind("<Motion>", self.update_cursor_position)
+            self.image_label.bind("<Button-1>", self.set_position)
+            self.image_label.bind("<ButtonRelease-1>", self.set_fit_box)
+        else:
+            self.image_label.unbind("<Motion>")
+            self.image_label.unbind("<Button-1>")
+            self.image_label.unbind("<ButtonRelease-1>")
+            self.cursor_pos_var.set("X: 0, Y: 0")
+    
+    def toggle_fit_inputs(self):
+        """Enable/disable the text box size fields"""
+        state = "normal" if self.fit_var.get() else "disabled"
+        self.fit_width_entry.config(state=state)
+        self.fit_height_entry.config(state=state)
+        self.update_preview(None)
+    
+    def event_to_image_coords(self, event):
+        """Convert a mouse event on the preview to template pixel coordinates"""
+        # Get canvas coordinates
+        canvas_x = self.canvas.canvasx(event.x)
+        canvas_y = self.canvas.canvasy(event.y)
+        
+        # Scale to original image coordinates
+        orig_width, orig_height = self.original_img.size
+        zoom_factor = self.zoom_level.get() / 100.0
+        prev_width, prev_height = self.preview_img.width(), self.preview_img.height()
+        
+        scale_x = orig_width / (prev_width / zoom_factor)
+        scale_y = orig_height / (prev_height / zoom_factor)
+        
+        return int(canvas_x * scale_x), int(canvas_y * scale_y)
+    
+    def update_cursor_position(self, event):
+        """Update cursor position display when hovering over image"""
+        if not self.original_img:
+            return
+        
+        orig_x, orig_y = self.event_to_image_coords(event)
+        self.cursor_pos_var.set(f"X: {orig_x}, Y: {orig_y}")
+    
+    def set_entry(self, entry, value):
+        """Replace the contents of an entry field"""
+        entry.delete(0, tk.END)
+        entry.insert(0, str(value))
+    
+    def set_position(self, event):
+        """Set X/Y position entries when clicking on image"""
+        if not self.original_img:
+            return
+        if self.place_target_var.get() == "field":
+            self.place_selected_field(*self.event_to_image_coords(event))
+            return
+        if self.position_mode.get() != "custom":
+            return
+        
+        orig_x, orig_y = self.event_to_image_coords(event)
+        # Remembered so a drag can define the fit box on release
+        self.drag_start = (orig_x, orig_y)
+        
+        # Update entry fields
+        self.set_entry(self.x_position_entry, orig_x)
+        self.set_entry(self.y_position_entry, orig_y)
+        
+        # Trigger preview update
+        self.preview_text()
+    
+    def set_fit_box(self, event):
+        """Turn a drag on the preview into a text box centered on its middle"""
+        start, self.drag_start = self.drag_start, None
+        if not start or not self.original_img or not self.fit_var.get():
+            return
+        
+        end_x, end_y = self.event_to_image_coords(event)
+        width, height = abs(end_x - start[0]), abs(end_y - start[1])
+        if width < MIN_BOX_DRAG or height < MIN_BOX_DRAG:
+            return
+        
+        self.set_entry(self.x_position_entry, (start[0] + end_x) // 2)
+        self.set_entry(self.y_position_entry, (start[1] + end_y) // 2)
+        self.set_entry(self.fit_width_entry, width)
+        self.set_entry(self.fit_height_entry, height)
+        self.preview_text()
+    
+    def schedule_zoom(self, value):
+        """Debounce zoom slider moves into a single preview refresh"""
+        if self.zoom_after_id:
+            self.root.after_cancel(self.zoom_after_id)
+        self.zoom_after_id = self.root.after(ZOOM_DEBOUNCE_MS, self.apply_zoom)
+    
+    def apply_zoom(self):
+        """Refresh the preview once the zoom slider has settled"""
+        self.zoom_after_id = None
+        self.update_preview(None)
+    
+    def update_preview(self, event):
+        """Update preview image based on zoom level"""
+        if not self.original_img:
+            return
+        
+        try:
+            zoom_factor = self.zoom_level.get() / 100.0
+            new_size = (
+                int(self.base_preview_size[0] * zoom_factor),
+                int(self.base_preview_size[1] * zoom_factor)
+            )
+            
+            self.preview_base = self.preview_pyramid.resized(new_size)
+            self.preview_img = ImageTk.PhotoImage(self.preview_base)
+            self.image_label.config(image=self.preview_img, text="")
+            self.image_label.image = self.preview_img
+            
+            # Update scroll region
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            
+            # Refresh preview text if applicable
+            if self.preview_text_var.get().strip():
+                self.preview_text()
+                
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to update preview:\n{e}")
+    
+    def select_image(self):
+        """Select certificate template image"""
+        path = filedialog.askopenfilename(
+            title="Select Certificate Image",
+            filetypes=[
+                ("Image Files", "*.png *.jpg *.jpeg *.bmp"),
+                ("PNG Files", "*.png"),
+                ("JPEG Files", "*.jpg *.jpeg"),
+                ("All Files", "*.*")
+            ]
+        )
+        if not path:
+            return
+        
+        self.cert_image_path.set(path)
+        
+        try:
+            min_preview_size = (
+                int(self.base_preview_size[0] * MIN_ZOOM / 100),
+                int(self.base_preview_size[1] * MIN_ZOOM / 100)
+            )
+            # Decoded once and cached on disk, so reopening a template is instant
+            self.original_img, self.preview_pyramid = load_template_pyramid(path, min_preview_size)
+            self.update_preview(None)  # Update with current zoom level
+            
+            width, height = self.original_img.size
+            messagebox.showinfo(
+                "Image Loaded",
+                f"✅ Image loaded successfully!\n\n"
+                f"Dimensions: {width} x {height} pixels\n\n"
+                f"Tip: If using custom position:\n"
+                f"• X range: 0 to {width}\n"
+                f"• Y range: 0 to {height}\n"
+                f"• Click on preview to set position\n"
+                f"• Use zoom slider to adjust view"
+            )
+            
+            # Bind mouse events if in custom mode or placing a field
+            self.update_click_bindings()
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load image:\n{e}")
+            self.cert_image_path.set("")
+    
+    def select_font(self):
+        """Select custom font file"""
+        path = filedialog.askopenfilename(
+            title="Select Font File",
+            filetypes=[
+                ("TrueType Font", "*.ttf"),
+                ("OpenType Font", "*.otf"),
+                ("All Files", "*.*")
+            ]
+        )
+        if path:
+            self.font_path_var.set(path)
+            self.preview_text()
+    
+    def select_names_file(self):
+        """Select a file to stream names from instead of the text box"""
+        path = filedialog.askopenfilename(
+            title="Select Names File",
+            filetypes=[
+                ("Name Lists", "*.csv *.tsv *.jsonl *.ndjson *.txt"),
+                ("CSV Files", "*.csv"),
+                ("TSV Files", "*.tsv"),
+                ("JSON Lines", "*.jsonl *.ndjson"),
+                ("Text Files", "*.txt"),
+                ("All Files", "*.*")
+            ]
+        )
+        if path:
+            self.names_file_var.set(path)
+    
+    def select_field_font(self):
+        """Select a font file for the field being edited"""
+        path = filedialog.askopenfilename(
+            title="Select Font File",
+            filetypes=[
+                ("TrueType Font", "*.ttf"),
+                ("OpenType Font", "*.otf"),
+                ("All Files", "*.*")
+            ]
+        )
+        if path:
+            self.field_font_var.set(path)
+    
+    def selected_field_index(self):
+        """Index into extra_fields of the field selected in the list, or None"""
+        selection = self.fields_tree.selection()
+        return int(selection[0]) if selection else None
+    
+    def refresh_field_list(self, select=None):
+        """Redraw the extra fields list, optionally selecting one field"""
+        self.fields_tree.delete(*self.fields_tree.get_children())
+        for index, text_field in enumerate(self.extra_fields):
+            self.fields_tree.insert("", tk.END, iid=str(index), values=(
+                text_field.column,
+                f"{text_field.x}, {text_field.y}",
+                text_field.font_size,
+                text_field.color,
+                text_field.align,
+                os.path.basename(text_field.font_path) or "(main font)"
+            ))
+        if select is not None:
+            self.fields_tree.selection_set(str(select))
+    
+    def read_field_editor(self, x=0, y=0):
+        """Build a TextField from the field editor, raising ValueError if invalid"""
+        column = self.field_column_entry.get().strip()
+        if not column:
+            raise ValueError("Please enter the column the field is taken from")
+        try:
+            font_size = validate_font_size(self.field_size_entry.get())
+        except ValueError:
+            raise ValueError("Field font size must be a number between 1 and 500")
+        color = self.field_color_entry.get().strip()
+        if not is_valid_color(color):
+            raise ValueError("Field color must be a #RRGGBB hex code, black or white")
+        return TextField(
+            column=column,
+            x=x,
+            y=y,
+            font_path=self.field_font_var.get(),
+            font_size=font_size,
+            color=color,
+            align=self.field_align_var.get()
+        )
+    
+    def add_field(self):
+        """Add a field from the editor, placed at the template center"""
+        x, y = 0, 0
+        if self.original_img:
+            x, y = self.original_img.width // 2, self.original_img.height // 2
+        try:
+            text_field = self.read_field_editor(x, y)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.extra_fields.append(text_field)
+        self.refresh_field_list(select=len(self.extra_fields) - 1)
+        # The next click on the preview moves the new field
+        self.place_target_var.set("field")
+        self.update_click_bindings()
+        self.preview_text()
+    
+    def update_field(self):
+        """Apply the editor settings to the selected field, keeping its position"""
+        index = self.selected_field_index()
+        if index is None:
+            messagebox.showinfo("Extra Fields", "Select a field in the list first.")
+            return
+        current = self.extra_fields[index]
+        try:
+            self.extra_fields[index] = self.read_field_editor(current.x, current.y)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.refresh_field_list(select=index)
+        self.preview_text()
+    
+    def remove_field(self):
+        """Delete the selected field"""
+        index = self.selected_field_index()
+        if index is None:
+            return
+        del self.extra_fields[index]
+        self.refresh_field_list()
+        self.preview_text()
+    
+    def load_selected_field(self, event):
+        """Show the selected field's settings in the editor"""
+        index = self.selected_field_index()
+        if index is None:
+            return
+        text_field = self.extra_fields[index]
+        self.set_entry(self.field_column_entry, text_field.column)
+        self.set_entry(self.field_size_entry, text_field.font_size)
+        self.set_entry(self.field_color_entry, text_field.color)
+        self.field_align_var.set(text_field.align)
+        self.field_font_var.set(text_field.font_path)
+    
+    def place_selected_field(self, x, y):
+        """Move the selected field's anchor to a clicked template position"""
+        index = self.selected_field_index()
+        if index is None:
+            messagebox.showinfo("Extra Fields", "Select a field in the list to place it.")
+            return
+        self.extra_fields[index] = replace(self.extra_fields[index], x=x, y=y)
+        self.refresh_field_list(select=index)
+        self.preview_text()
+    
+    def preview_values(self):
+        """Sample text for the extra fields: the names file's first row if loaded"""
+        values = {text_field.column: f"[{text_field.column}]" for text_field in self.extra_fields}
+        names_file = self.names_file_var.get()
+        if self.extra_fields and names_file:
+            try:
+                first_row = next(iter(NameSource(names_file).rows()), {})
+            except (OSError, ValueError):
+                first_row = {}
+            for column in values:
+                if first_row.get(column):
+                    values[column] = first_row[column]
+        return values
+    
+    def update_hex_from_radio(self):
+        """Update hex color entry when a predefined color is selected"""
+        if self.font_color_var.get() != "custom":
+            self.hex_color_var.set(self.font_color_var.get())
+            self.hex_color_entry.config(foreground="black")
+            self.preview_text()
+    
+    def update_from_hex_entry(self):
+        """Update font color when hex entry is used or custom is selected"""
+        if self.font_color_var.get() == "custom":
+            self.validate_hex_color(None)
+            self.preview_text()
+    
+    def validate_hex_color(self, event):
+        """Validate hex color input and update font_color_var"""
+        hex_color = self.hex_color_var.get().strip()
+        if self.font_color_var.get() != "custom":
+            return
+        
+        # Check if the input is a valid hex color
+        if re.match(r'^#[0-9A-Fa-f]{6}$', hex_color):
+            self.font_color_var.set(hex_color)
+            self.hex_color_entry.config(foreground="black")
+            self.preview_text()
+        else:
+            self.hex_color_entry.config(foreground="red")  # Indicate invalid input
+            self.font_color_var.set("black")  # Fallback to black
+            self.preview_text()
+    
+    def open_color_chooser(self):
+        """Open color chooser dialog and update hex color"""
+        color = colorchooser.askcolor(title="Choose Font Color")[1]  # Returns hex color or None
+        if color:
+            self.font_color_var.set("custom")
+            self.hex_color_var.set(color.upper())
+            self.validate_hex_color(None)
+    
+    def get_font_color(self):
+        """Get valid font color, with fallback to black if invalid"""
+        color = self.font_color_var.get()
+        if color == "custom":
+            color = self.hex_color_var.get()
+        if is_valid_color(color):
+            return color
+        messagebox.showwarning("Warning", "Invalid color format. Using black as fallback.")
+        return "black"
+    
+    def build_render_spec(self):
+        """Collect the current form settings into a RenderSpec"""
+        try:
+            font_size = validate_font_size(self.font_size_entry.get())
+        except ValueError:
+            raise ValueError("Font size must be a number between 1 and 500")
+        
+        spec = RenderSpec(
+            template_path=self.cert_image_path.get(),
+            font_path=self.font_path_var.get().strip(),
+            font_size=font_size,
+            color=self.get_font_color(),
+            position_mode=self.position_mode.get()
+        )
+        if spec.position_mode == "custom":
+            try:
+                spec.x = int(self.x_position_entry.get())
+                spec.y = int(self.y_position_entry.get())
+            except ValueError:
+                raise ValueError("Invalid position coordinates")
+        if self.fit_var.get():
+            try:
+                spec.fit_width = int(self.fit_width_entry.get())
+                spec.fit_height = int(self.fit_height_entry.get())
+            except ValueError:
+                raise ValueError("Text box size must be whole numbers of pixels")
+            if spec.fit_width <= 0 or spec.fit_height <= 0:
+                raise ValueError("Text box width and height must be greater than 0")
+        spec.fields = [replace(text_field) for text_field in self.extra_fields]
+        return spec
+    
+    def preview_text(self, exact=False):
+        """Preview text on certificate
+
+        By default the text is drawn straight onto the zoomed preview with a
+        scaled font. With ``exact`` it is rendered at full resolution first
+        and then scaled down, matching the generated certificates exactly.
+        """
+        if not self.original_img:
+            messagebox.showwarning("Warning", "Please select a certificate image first")
+            return
+        
+        try:
+            try:
+                spec = self.build_render_spec()
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
+            
+            font = self.get_font(spec)
+            preview_text = self.preview_text_var.get().strip() or "Sample Name"
+            renderer = CertificateRenderer(spec, template=self.original_img, font=font)
+            
+            try:
+                if exact:
+                    zoom_factor = self.zoom_level.get() / 100.0
+                    new_size = (
+                        int(self.base_preview_size[0] * zoom_factor),
+                        int(self.base_preview_size[1] * zoom_factor)
+                    )
+                    img = renderer.render(preview_text, self.preview_values())
+                    img.thumbnail(new_size, Image.Resampling.LANCZOS)
+                else:
+                    img = renderer.render_onto(self.preview_base.copy(), preview_text, self.preview_values())
+            except PositionError as e:
+                messagebox.showwarning("Warning", str(e))
+                return
+            
+            if spec.fit_to_box:
+                self.draw_fit_box(img, spec)
+            
+            self.preview_img = ImageTk.PhotoImage(img)
+            self.image_label.config(image=self.preview_img, text="")
+            self.image_label.image = self.preview_img
+            
+            # Update scroll region
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to preview text:\n{e}")
+    
+    def draw_fit_box(self, img, spec):
+        """Outline the fit-to-box area on a preview image"""
+        if spec.position_mode == "custom":
+            center_x, center_y = spec.x, spec.y
+        else:
+            center_x, center_y = self.original_img.width / 2, self.original_img.height / 2
+        scale = img.width / self.original_img.width
+        left = (center_x - spec.fit_width / 2) * scale
+        top = (center_y - spec.fit_height / 2) * scale
+        ImageDraw.Draw(img).rectangle(
+            (left, top, left + spec.fit_width * scale, top + spec.fit_height * scale),
+            outline="#3498db"
+        )
+    
+    def get_font(self, spec):
+        """Get font with error handling"""
+        try:
+            font, is_fallback = load_font(spec.font_path, spec.font_size)
+            if is_fallback:
+                messagebox.showwarning(
+                    "Font Warning",
+                    "Using default font. For better results, select a custom font."
+                )
+            return font
+            
+        except Exception as e:
+            messagebox.showwarning("Font Error", f"Error loading font: {e}\nUsing default font.")
+            return ImageFont.load_default()
+    
+    def validate_output_dir(self, output_dir):
+        """Validate if output directory is writable"""
+        try:
+            test_file = os.path.join(output_dir, ".test_write")
+            with open(test_file, "w") as f:
+                f.write("test")
+            os.remove(test_file)
+            return True
+        except:
+            return False
+    
+    def generate_certificates(self):
+        """Generate certificates for all names"""
+        if self.batch_thread:
+            return
+        
+        img_path = self.cert_image_path.get()
+        if not img_path:
+            messagebox.showerror("Error", "Please select a certificate image")
+            return
+        
+        names_file = self.names_file_var.get()
+        if names_file:
+            # Read lazily on the batch thread; the file is never loaded whole
+            try:
+                names = NameSource(names_file)
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to open names file:\n{e}")
+                return
+        else:
+            names_text = self.names_entry.get("1.0", "end").strip()
+            if not names_text:
+                messagebox.showerror("Error", "Please enter at least one name or load a names file")
+                return
+            names = [n.strip() for n in names_text.split("\n") if n.strip()]
+        
+        default_downloads = os.path.join(os.path.expanduser("~"), "Downloads")
+        output_dir = filedialog.askdirectory(
+            title="Select Save Location",
+            initialdir=default_downloads
+        )
+        if not output_dir:
+            messagebox.showinfo("Canceled", "No folder selected. Operation canceled.")
+            return
+        
+        if not self.validate_output_dir(output_dir):
+            messagebox.showerror("Error", "Selected folder is not writable")
+            return
+        
+        try:
+            spec = self.build_render_spec()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
+        try:
+            jobs = max(int(self.jobs_entry.get()), 1)
+        except ValueError:
+            messagebox.showerror("Error", "Worker processes must be a whole number")
+            return
+        
+        try:
+            # Surface font warnings now; the template is loaded on the batch thread
+            self.get_font(spec)
+        except Exception as e:
+            messagebox.showerror("Error", f"An unexpected error occurred:\n{e}")
+            return
+        
+        output = OutputSpec(
+            output_dir,
+            encoder=encoder_preset(dict(OUTPUT_FORMATS)[self.output_format_var.get()]),
+            archive=dict(ARCHIVE_CHOICES)[self.archive_var.get()]
+        )
+        if output.archive and output.encoder.image_format == "PDF":
+            messagebox.showerror("Error", "Archives can only be used with image formats, not PDF")
+            return
+        self.start_batch(spec, names, output, jobs, self.resume_var.get())
+    
+    def start_batch(self, spec, names, output, jobs, resume=False):
+        """Run a batch on a background thread and poll it from the event loop"""
+        control = BatchControl()
+        last_update = [0.0]
+        
+        def on_progress(done, fraction):
+            # Throttle: the event loop only needs the latest value
+            now = time.monotonic()
+            if fraction >= 1 or now - last_update[0] >= PROGRESS_INTERVAL_MS / 1000:
+                last_update[0] = now
+                self.batch_queue.put(("progress", fraction))
+        
+        def run():
+            try:
+                result = generate_certificates(
+                    spec,
+                    names,
+                    output,
+                    jobs=jobs,
+                    progress=on_progress,
+                    control=control,
+                    manifest=JobManifest.for_output(output),
+                    resume=resume
+                )
+                self.batch_queue.put(("done", result))
+            except Exception as e:
+                self.batch_queue.put(("error", e))
+        
+        self.batch_control = control
+        self.batch_output = output
+        self.progress_var.set(0)
+        self.set_batch_running(True)
+        
+        self.batch_thread = threading.Thread(target=run, daemon=True)
+        self.batch_thread.start()
+        self.root.after(PROGRESS_INTERVAL_MS, self.poll_batch)
+    
+    def poll_batch(self):
+        """Apply queued batch events on the Tk thread"""
+        finished = None
+        try:
+            while True:
+                event = self.batch_queue.get_nowait()
+                if event[0] == "progress":
+                    self.progress_var.set(event[1] * 100)
+                else:
+                    finished = event
+        except queue.Empty:
+            pass
+        
+        if finished is None:
+            self.root.after(PROGRESS_INTERVAL_MS, self.poll_batch)
+            return
+        
+        cancelled = self.batch_control.cancelled
+        self.batch_thread = None
+        self.batch_control = None
+        self.set_batch_running(False)
+        
+        if finished[0] == "error":
+            messagebox.showerror("Error", f"An unexpected error occurred:\n{finished[1]}")
+        else:
+            self.show_batch_results(finished[1], cancelled=cancelled)
+    
+    def set_batch_running(self, running):
+        """Lock the form while a batch is running so it can't be restarted"""
+        self.generate_button.config(state="disabled" if running else "normal")
+        self.reset_button.config(state="disabled" if running else "normal")
+        self.pause_button.config(state="normal" if running else "disabled", text="Pause")
+        self.cancel_button.config(state="normal" if running else "disabled")
+    
+    def toggle_pause(self):
+        """Pause or resume the running batch"""
+        if not self.batch_control:
+            return
+        if self.batch_control.paused:
+            self.batch_control.resume()
+            self.pause_button.config(text="Pause")
+        else:
+            self.batch_control.pause()
+            self.pause_button.config(text="Resume")
+    
+    def cancel_batch(self):
+        """Stop the running batch after the certificates in progress"""
+        if self.batch_control:
+            self.batch_control.cancel()
+            self.pause_button.config(state="disabled")
+            self.cancel_button.config(state="disabled")
+    
+    def on_close(self):
+        """Cancel any running batch before closing the window"""
+        if self.batch_control:
+            self.batch_control.cancel()
+        self.root.destroy()
+    
+    def show_batch_results(self, result, cancelled=False):
+        """Write the run report and summarize the finished batch"""
+        if not (cancelled or result.success_count or result.failed_names or result.skipped_count):
+            messagebox.showwarning("No Names", "No names were found to generate certificates for.")
+            return
+        
+        report = build_report(result, self.batch_output, cancelled=cancelled)
+        try:
+            saved_report = write_report(report, report_path(self.batch_output.output_dir))
+        except OSError:
+            saved_report = None
+        
+        if cancelled:
+            title, headline = "Canceled", "Generation canceled."
+        elif not result.failed_names:
+            title, headline = "Success! 🎉", "✅ All certificates generated successfully!"
+        elif result.success_count:
+            title, headline = "Partial Success", "⚠ Some certificates failed to generate."
+        else:
+            title, headline = "Failed", "❌ All certificates failed to generate."
+        
+        lines = [headline, ""] + summary_lines(report) + ["", f"Saved to:\n{report['output']}"]
+        if saved_report:
+            lines.append(f"\nReport:\n{saved_report}")
+        if result.failed_names:
+            lines += ["", "Failed names:"] + result.failed_names
+        self.show_report_dialog(title, "\n".join(lines))
+    
+    def show_report_dialog(self, title, text):
+        """Show a scrollable, read-only summary in a modal window"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        
+        text_frame = ttk.Frame(dialog)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical")
+        body = tk.Text(
+            text_frame,
+            height=16,
+            width=70,
+            wrap="word",
+            font=("Helvetica", 10),
+            relief="flat",
+            yscrollcommand=scrollbar.set
+        )
+        scrollbar.config(command=body.yview)
+        body.insert("1.0", text)
+        body.config(state="disabled")
+        body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=(0, 10))
+        dialog.grab_set()
+        dialog.focus_set()
+    
+    def reset_form(self):
+        """Reset all form inputs"""
+        self.cert_image_path.set("")
+        self.font_path_var.set("")
+        self.position_mode.set("center")
+        self.x_position_entry.delete(0, tk.END)
+        self.x_position_entry.insert(0, "0")
+        self.y_position_entry.delete(0, tk.END)
+        self.y_position_entry.insert(0, "0")
+        self.fit_var.set(False)
+        for entry in (self.fit_width_entry, self.fit_height_entry):
+            entry.config(state="normal")
+            self.set_entry(entry, 0)
+        self.toggle_fit_inputs()
+        self.extra_fields = []
+        self.refresh_field_list()
+        self.set_entry(self.field_column_entry, "")
+        self.set_entry(self.field_size_entry, 36)
+        self.set_entry(self.field_color_entry, "black")
+        self.field_align_var.set("center")
+        self.field_font_var.set("")
+        self.place_target_var.set("name")
+        self.toggle_position_inputs()
+        self.font_size_entry.delete(0, tk.END)
+        self.font_size_entry.insert(0, str(self.default_font_size))
+        self.font_color_var.set("black")
+        self.hex_color_var.set("#000000")
+        self.hex_color_entry.config(foreground="black")
+        self.names_entry.delete("1.0", tk.END)
+        self.names_file_var.set("")
+        self.resume_var.set(False)
+        self.output_format_var.set(OUTPUT_FORMATS[0][0])
+        self.archive_var.set(ARCHIVE_CHOICES[0][0])
+        self.jobs_entry.delete(0, tk.END)
+        self.jobs_entry.insert(0, str(default_jobs()))
+        self.preview_text_var.set("Sample Name")
+        self.zoom_level.set(100.0)
+        self.image_label.config(
+            image="",
+            text="📷 No image loaded\n\nClick 'Browse Image' to get started"
+        )
+        self.cursor_pos_var.set("X: 0, Y: 0")
+        self.preview_img = None
+        self.original_img = None
+        self.preview_pyramid = None
+        self.preview_base = None
+        self.progress_var.set(0)
+
+def run():
+    """Open the main window and run the Tk event loop"""
+    root = tk.Tk()
+    CertificateGenerator(root)
+    root.mainloop()
\ No newline at end of file
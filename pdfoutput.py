@@ -0,0 +1,110 @@
+"""PDF certificates with the template embedded once and names as real text.
+
+Every page draws the same template image XObject and overlays the name
+as vector text in an embedded subset of the chosen TrueType font, so a
+multi-page document costs little more than the template itself.
+
+Needs the optional reportlab package (``pip install reportlab``).
+"""
+import hashlib
+import os
+
+from PIL import Image, ImageColor
+
+from renderer import CertificateRenderer
+
+POINTS_PER_INCH = 72
+
+
+def _reportlab():
+    """Import reportlab on first use so the rest of the app works without it"""
+    try:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        raise RuntimeError("PDF output needs the reportlab package (pip install reportlab)")
+    return canvas, pdfmetrics, TTFont
+
+
+class PdfCertificateWriter:
+    """Writes certificates as PDF pages laid out exactly like the PNG output"""
+
+    def __init__(self, spec, encoder):
+        self.canvas_module, self.pdfmetrics, self.TTFont = _reportlab()
+        self.spec = spec
+
+        # Only the header is read here; reportlab embeds the file itself
+        with Image.open(spec.template_path) as template:
+            self.renderer = CertificateRenderer(spec, template=template)
+            dpi = encoder.dpi or template.info.get("dpi", (POINTS_PER_INCH,))[0] or POINTS_PER_INCH
+        self.scale = POINTS_PER_INCH / float(dpi)
+        width, height = self.renderer.size
+        self.page_size = (width * self.scale, height * self.scale)
+
+        self.font_name = self._register_font(self.renderer.font)
+        self.color = self._rgb(spec.color)
+        # Extra fields set in another font, by font file
+        self._field_fonts = {}
+
+    def _register_font(self, font):
+        """Embed a loaded Pillow font's file; returns its reportlab font name"""
+        font_path = getattr(font, "path", None)
+        if not isinstance(font_path, str) or not os.path.exists(font_path):
+            raise ValueError("PDF output needs a TrueType font file; please select one")
+        # reportlab keeps a global font registry, so name fonts by their path
+        font_name = "CertFont-" + hashlib.sha1(font_path.encode("utf-8")).hexdigest()[:12]
+        try:
+            self.pdfmetrics.getFont(font_name)
+        except KeyError:
+            try:
+                self.pdfmetrics.registerFont(self.TTFont(font_name, font_path))
+            except Exception as e:
+                raise ValueError(f"Font can't be embedded in a PDF (TrueType outlines only): {e}")
+        return font_name
+
+    @staticmethod
+    def _rgb(color):
+        return [c / 255 for c in ImageColor.getrgb(color)[:3]]
+
+    def _field_font_name(self, text_field, metrics):
+        font_path = text_field.font_path or self.spec.font_path
+        if font_path == self.spec.font_path:
+            return self.font_name
+        if font_path not in self._field_fonts:
+            self._field_fonts[font_path] = self._register_font(metrics.font)
+        return self._field_fonts[font_path]
+
+    def open(self, path):
+        """Start a PDF document at path"""
+        return self.canvas_module.Canvas(path, pagesize=self.page_size, pageCompression=1)
+
+    def add_page(self, pdf, name, values=None):
+        """Append a certificate page; raises PositionError if it doesn't fit"""
+        x, y, font_size = self.renderer.layout(name)
+        metrics = self.renderer.metrics_at(font_size)
+        field_layouts = self.renderer.field_layouts(values)
+        width, height = self.page_size
+
+        # Same filename every page, so reportlab stores the image only once
+        pdf.drawImage(self.spec.template_path, 0, 0, width, height)
+        self._draw_text(pdf, name, x, y, metrics, self.font_name, font_size, self.color)
+        for text_field, text, field_x, field_y, field_metrics in field_layouts:
+            font_name = self._field_font_name(text_field, field_metrics)
+            self._draw_text(pdf, text, field_x, field_y, field_metrics, font_name,
+                            text_field.font_size, self._rgb(text_field.color))
+        pdf.showPage()
+
+    def _draw_text(self, pdf, text, x, y, metrics, font_name, font_size, color):
+        ascent = metrics.font.getmetrics()[0]
+        pdf.setFillColorRGB(*color)
+        pdf.setFont(font_name, font_size * self.scale)
+        # Pillow positions text by its top-left corner, PDF by the baseline
+        pdf.drawString(x * self.scale, self.page_size[1] - (y + ascent) * self.scale, text)
+
+    def write(self, path, name, values=None):
+        """Write a single-page PDF for one name"""
+        pdf = self.open(path)
+        self.add_page(pdf, name, values)
+        pdf.save()
+        return path
@@ -0,0 +1,691 @@
+"""Headless certificate rendering engine.
+
+Everything in here works on plain data (paths, sizes, colors, coordinates)
+and only depends on Pillow, so it can be driven from the Tkinter app, a
+script, or a render server without a display.
+"""
+import hashlib
+import io
+import math
+import os
+import re
+import threading
+import unicodedata
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from PIL import Image, ImageDraw, ImageFont
+
+from encoders import EncoderSpec, encode_image
+from templatecache import SharedTemplate, TemplateCache, decode_template
+
+DEFAULT_FONT_SIZE = 72
+MIN_FONT_SIZE = 1
+MAX_FONT_SIZE = 500
+SYSTEM_FONTS = ["arial.ttf", "times.ttf", "helvetica.ttf"]
+HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+NAMED_COLORS = ["black", "white"]
+# Longest filename slug in characters, to keep filenames readable
+MAX_SLUG_LENGTH = 80
+# Filesystems limit a filename to 255 bytes (ext4, APFS) or UTF-16 units
+# (NTFS), and one CJK or astral-plane letter takes 3-4 bytes in UTF-8
+MAX_FILENAME_BYTES = 255
+# Room kept for the "_N" suffix given to repeated names
+SUFFIX_RESERVE_BYTES = 10
+# Smallest size auto-fit will shrink a name to before giving up
+MIN_FIT_FONT_SIZE = 8
+# Loaded font faces kept around; each distinct (path, size) pair is one entry
+FONT_CACHE_SIZE = 32
+# Trial font sizes a renderer keeps glyph tables for during fit-to-box; the
+# fonts themselves are left to FONT_CACHE_SIZE
+SIZED_METRICS_SIZE = 256
+# Horizontal alignment of an extra text field relative to its anchor point
+FIELD_ALIGNMENTS = ("left", "center", "right")
+
+
+class PositionError(ValueError):
+    """Raised when the text would be placed outside the template"""
+
+
+@dataclass
+class TextField:
+    """An extra line of text, such as a course or date, taken from a row column
+
+    The text is vertically centered on ``y``; ``align`` says whether it
+    starts at, is centered on, or ends at ``x``. An empty ``font_path``
+    uses the certificate's main font.
+    """
+    column: str
+    x: int = 0
+    y: int = 0
+    font_path: str = ""
+    font_size: int = 36
+    color: str = "black"
+    align: str = "center"
+
+
+@dataclass
+class RenderSpec:
+    """Everything needed to draw a name onto a template"""
+    template_path: str = ""
+    font_path: str = ""
+    font_size: int = DEFAULT_FONT_SIZE
+    color: str = "black"
+    position_mode: str = "center"  # "center" or "custom"
+    x: int = 0
+    y: int = 0
+    # Fit-to-box: when set, each name is shrunk from font_size until it fits
+    # a box of this size centered on the text position (0 = no limit)
+    fit_width: int = 0
+    fit_height: int = 0
+    # Extra TextFields drawn in the same pass, filled from each input row
+    fields: list = field(default_factory=list)
+
+    @property
+    def fit_to_box(self):
+        return bool(self.fit_width or self.fit_height)
+
+
+@dataclass
+class OutputSpec:
+    """Where and how rendered certificates are written"""
+    output_dir: str
+    prefix: str = "certificate_"
+    encoder: EncoderSpec = field(default_factory=EncoderSpec)
+    # "zip" or "tar" to stream everything into one archive instead of loose files
+    archive: str = ""
+    # fsync each file before counting it as saved: slower, but a certificate
+    # reported as done survives a crash or an unplugged drive
+    fsync: bool = False
+
+    @property
+    def extension(self):
+        return self.encoder.extension
+
+
+def is_valid_color(color):
+    """Check for a #RRGGBB hex color or one of the supported color names"""
+    return bool(HEX_COLOR_RE.match(color)) or color in NAMED_COLORS
+
+
+def validate_font_size(font_size):
+    """Return the font size as an int, raising ValueError if out of range"""
+    font_size = int(font_size)
+    if font_size < MIN_FONT_SIZE or font_size > MAX_FONT_SIZE:
+        raise ValueError("Font size out of range")
+    return font_size
+
+
+class FontCache:
+    """LRU cache of loaded font faces keyed by (resolved path, size)
+
+    Fonts that fail to load are remembered in a negative cache so missing
+    system fonts are not probed on the filesystem again.
+    """
+
+    def __init__(self, max_size=FONT_CACHE_SIZE):
+        self.max_size = max_size
+        self._fonts = OrderedDict()
+        self._missing = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _resolve(font_path):
+        # Bare names such as "arial.ttf" are looked up by FreeType itself
+        if os.path.dirname(font_path):
+            return os.path.realpath(font_path)
+        return font_path
+
+    def get(self, font_path, font_size):
+        """Return a loaded font, raising OSError if it can't be loaded"""
+        path = self._resolve(font_path)
+        key = (path, font_size)
+        with self._lock:
+            if path in self._missing:
+                raise OSError(f"cannot open resource: {font_path}")
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                return font
+
+        try:
+            font = ImageFont.truetype(path, font_size)
+        except OSError:
+            with self._lock:
+                self._missing.add(path)
+            raise
+
+        with self._lock:
+            self._fonts[key] = font
+            self._fonts.move_to_end(key)
+            while len(self._fonts) > self.max_size:
+                self._fonts.popitem(last=False)
+        return font
+
+    def clear(self):
+        """Forget all loaded and missing fonts (e.g. after installing fonts)"""
+        with self._lock:
+            self._fonts.clear()
+            self._missing.clear()
+
+
+font_cache = FontCache()
+# Decoded templates shared across runs and processes; None when disabled
+template_cache = TemplateCache.from_environment()
+
+
+def load_font(font_path, font_size):
+    """Load a font, falling back to system fonts and then Pillow's default
+
+    Returns a ``(font, is_fallback)`` tuple where ``is_fallback`` is True
+    when neither the requested font nor a system font could be loaded.
+    Loaded faces are shared through ``font_cache``.
+    """
+    font_size = validate_font_size(font_size)
+    if font_path and os.path.exists(font_path):
+        return font_cache.get(font_path, font_size), False
+
+    # Try system fonts
+    for sys_font in SYSTEM_FONTS:
+        try:
+            return font_cache.get(sys_font, font_size), False
+        except OSError:
+            continue
+
+    return ImageFont.load_default(), True
+
+
+def load_template(template_path):
+    """Decode a template image and convert it to RGB
+
+    With the template cache enabled the pixels are mapped from an earlier
+    decode when there is one; that image is read-only and in RGBX mode,
+    so use writable_copy() to draw on it.
+    """
+    if template_cache is None:
+        return decode_template(template_path)
+    return template_cache.load(template_path)
+
+
+def share_template(template_path):
+    """Place the decoded template where worker processes can map it
+
+    Returns a SharedTemplate backed by the template cache entry, or by a
+    temporary file when the cache is off; close() it once the workers are
+    done.
+    """
+    return SharedTemplate.create(template_path, template_cache)
+
+
+def writable_copy(image):
+    """A drawable copy of a template; mapped RGBX templates become plain RGB"""
+    if image.mode == "RGBX":
+        return image.convert("RGB")
+    return image.copy()
+
+
+def load_template_pyramid(template_path, min_size):
+    """Return the RGB template and an ImagePyramid of it, cached like load_template"""
+    if template_cache is None:
+        template = decode_template(template_path)
+        return template, ImagePyramid(template, min_size)
+    levels = template_cache.load_levels(template_path)
+    return levels[0], ImagePyramid.from_levels(levels, min_size)
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def safe_filename(name, max_bytes=MAX_FILENAME_BYTES - SUFFIX_RESERVE_BYTES):
+    """Turn a name into a filename slug, keeping letters from any script
+
+    Letters, combining marks and digits of every script are kept (so
+    Arabic or CJK names stay readable), runs of whitespace become "_" and
+    everything else is dropped. The slug is cut to MAX_SLUG_LENGTH
+    characters and to ``max_bytes`` of UTF-8, at a character boundary. A
+    name with nothing usable left gets a short hash so different names
+    still get different files.
+    """
+    name = unicodedata.normalize("NFC", name)
+    kept = []
+    for ch in name:
+        if ch.isspace():
+            kept.append(" ")
+        elif ch in "-_" or unicodedata.category(ch)[0] in "LMN":
+            kept.append(ch)
+    slug = re.sub(r"\s+", "_", "".join(kept).strip())[:MAX_SLUG_LENGTH]
+    # A multi-byte character cut in half is dropped by "ignore"
+    slug = slug.encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+    if not slug:
+        slug = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return slug
+
+
+class OutputAllocator:
+    """Hands out unique output paths from an in-memory index
+
+    The output directory is listed once with os.scandir; after that each
+    name is resolved without touching the filesystem, and repeated names
+    continue numbering from the last suffix handed out instead of probing
+    _1, _2, ... again. Filenames are compared case-insensitively and in
+    NFC form so results are also unique on Windows and macOS filesystems.
+    """
+
+    def __init__(self, output, scan=True):
+        self.output = output
+        self._taken = set()
+        self._next_suffix = {}
+        # A new archive starts empty, so there is no directory to scan
+        if scan and os.path.isdir(output.output_dir):
+            with os.scandir(output.output_dir) as entries:
+                for entry in entries:
+                    self._taken.add(self._index_key(entry.name))
+
+    @staticmethod
+    def _index_key(filename):
+        return unicodedata.normalize("NFC", filename).casefold()
+
+    def allocate(self, name):
+        """Reserve and return an unused path for this name"""
+        # The prefix, a "_N" suffix and the extension must fit next to the slug
+        budget = (
+            MAX_FILENAME_BYTES - SUFFIX_RESERVE_BYTES
+            - len(self.output.prefix.encode("utf-8")) - len(self.output.extension.encode("utf-8"))
+        )
+        return self.allocate_stem(f"{self.output.prefix}{safe_filename(name, max(budget, 8))}")
+
+    def allocate_stem(self, stem):
+        """Reserve and return an unused path starting with this filename stem"""
+        extension = self.output.extension
+        filename = f"{stem}{extension}"
+
+        if self._index_key(filename) in self._taken:
+            counter = self._next_suffix.get(stem, 1)
+            while self._index_key(f"{stem}_{counter}{extension}") in self._taken:
+                counter += 1
+            filename = f"{stem}_{counter}{extension}"
+            self._next_suffix[stem] = counter + 1
+
+        self._taken.add(self._index_key(filename))
+        return os.path.join(self.output.output_dir, filename)
+
+
+def fit_size(size, bounds):
+    """Size that fits ``size`` within ``bounds`` keeping its aspect ratio,
+    never upscaling (the same rule as Image.thumbnail)"""
+    scale = min(bounds[0] / size[0], bounds[1] / size[1], 1)
+    return max(round(size[0] * scale), 1), max(round(size[1] * scale), 1)
+
+
+class ImagePyramid:
+    """Successively halved copies of an image for fast downscaled views
+
+    Building the levels costs about one extra third of the image's pixels
+    once; afterwards every resize starts from the smallest level that is
+    still at least as large as the requested size.
+    """
+
+    def __init__(self, image, min_size):
+        if image.mode not in ("L", "RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+        self.levels = [image]
+        while image.width // 2 >= min_size[0] and image.height // 2 >= min_size[1]:
+            image = image.reduce(2)
+            self.levels.append(image)
+
+    @classmethod
+    def from_levels(cls, levels, min_size):
+        """Build a pyramid from already halved levels, such as cached ones"""
+        pyramid = cls.__new__(cls)
+        pyramid.levels = [levels[0]]
+        for level in levels[1:]:
+            if level.width < min_size[0] or level.height < min_size[1]:
+                break
+            pyramid.levels.append(level)
+        return pyramid
+
+    @property
+    def size(self):
+        return self.levels[0].size
+
+    def resized(self, bounds):
+        """Return a new image downscaled to fit within bounds"""
+        target = fit_size(self.size, bounds)
+        source = self.levels[0]
+        for level in self.levels[1:]:
+            if level.width < target[0] or level.height < target[1]:
+                break
+            source = level
+        if source.size == target:
+            return writable_copy(source)
+        resized = source.resize(target, Image.Resampling.LANCZOS)
+        return resized.convert("RGB") if resized.mode == "RGBX" else resized
+
+
+class TextMetrics:
+    """Text bounding boxes composed from cached per-glyph metrics
+
+    Laying out every name in full just to center it repeats the same work
+    for the same glyphs over and over. Instead, each glyph's ink box and
+    advance and each glyph pair's kerning are measured once per font, and
+    a name's box is assembled from those tables. This reproduces Pillow's
+    basic layout exactly; for the Raqm layout (complex scripts), multiline
+    text, or if a spot check ever disagrees, the box is measured directly.
+    """
+
+    # Composed boxes checked against a real layout before trusting the tables
+    SPOT_CHECKS = 8
+
+    def __init__(self, font, mode="RGB", load=None):
+        # Given a loader, the font is only referenced weakly so the font
+        # cache's eviction frees it; it is loaded again if still needed
+        self._load = load
+        self._font = weakref.ref(font) if load is not None else font
+        # Measure on a scratch image so a lazily opened template isn't decoded
+        self._draw = ImageDraw.Draw(Image.new(mode, (1, 1)))
+        self._glyphs = {}
+        self._kerning = {}
+        self._checks_left = self.SPOT_CHECKS
+        self._composable = (
+            isinstance(font, ImageFont.FreeTypeFont)
+            and font.layout_engine == ImageFont.Layout.BASIC
+        )
+
+    @property
+    def font(self):
+        if self._load is None:
+            return self._font
+        font = self._font()
+        if font is None:
+            font = self._load()
+            self._font = weakref.ref(font)
+        return font
+
+    def _glyph(self, char):
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self._glyphs[char] = (self.font.getbbox(char), self.font.getlength(char))
+        return glyph
+
+    def _kern(self, pair):
+        kern = self._kerning.get(pair)
+        if kern is None:
+            kern = self._kerning[pair] = (
+                self.font.getlength(pair) - self._glyph(pair[0])[1] - self._glyph(pair[1])[1]
+            )
+        return kern
+
+    def _compose(self, text):
+        """Assemble the box from glyph tables; None if there is no ink"""
+        pen = 0.0
+        left = top = float("inf")
+        right = bottom = float("-inf")
+        previous = None
+        for char in text:
+            if previous is not None:
+                pen += self._kern(previous + char)
+            (x0, y0, x1, y1), advance = self._glyph(char)
+            if x1 > x0:
+                left = min(left, pen + x0)
+                right = max(right, pen + x1)
+            top = min(top, y0)
+            bottom = max(bottom, y1)
+            pen += advance
+            previous = char
+        if right < left:
+            return None
+        # FreeType positions are 26.6 fixed point, rounded half up to pixels
+        return math.floor(left + 0.5), top, math.floor(right + 0.5), bottom
+
+    def bbox(self, text):
+        """Bounding box of text drawn at (0, 0), as draw.textbbox returns it"""
+        if not self._composable or "\n" in text:
+            return self._draw.textbbox((0, 0), text, font=self.font)
+        box = self._compose(text)
+        if box is None or self._checks_left:
+            exact = self._draw.textbbox((0, 0), text, font=self.font)
+            if box is not None:
+                self._checks_left -= 1
+                if box != exact:
+                    self._composable = False
+            return exact
+        return box
+
+    def size(self, text):
+        """Return the (width, height) of the rendered text"""
+        bbox = self.bbox(text)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
+class CertificateRenderer:
+    """Draws names onto a template image according to a RenderSpec"""
+
+    def __init__(self, spec, template=None, font=None, canvas=None):
+        self.spec = spec
+        self.template = template if template is not None else load_template(spec.template_path)
+        self.font = font if font is not None else load_font(spec.font_path, spec.font_size)[0]
+        self.metrics = TextMetrics(self.font, self.template.mode)
+        # LRU of metrics per trial font size for fit-to-box, holding their
+        # fonts weakly; the spec's own size is always self.metrics
+        self._sized_metrics = OrderedDict()
+        # Metrics for extra fields set in another font, by (path, size)
+        self._field_metrics = {}
+        # Reused canvas for render_incremental and the text boxes last drawn on it;
+        # one passed in (e.g. a copy-on-write mapping) must start as the template
+        self._canvas = canvas
+        self._dirty_boxes = []
+
+    @property
+    def size(self):
+        return self.template.size
+
+    def metrics_at(self, font_size):
+        """TextMetrics (and through it, the font) for this spec at another size"""
+        if font_size == self.spec.font_size:
+            return self.metrics
+        metrics = self._sized_metrics.get(font_size)
+        if metrics is not None:
+            self._sized_metrics.move_to_end(font_size)
+            return metrics
+        font, is_fallback = load_font(self.spec.font_path, font_size)
+        # Pillow's default font isn't in the font cache, so it is held
+        load = None if is_fallback else lambda: load_font(self.spec.font_path, font_size)[0]
+        metrics = self._sized_metrics[font_size] = TextMetrics(font, self.template.mode, load)
+        while len(self._sized_metrics) > SIZED_METRICS_SIZE:
+            self._sized_metrics.popitem(last=False)
+        return metrics
+
+    def _fits(self, text, font_size):
+        text_width, text_height = self.metrics_at(font_size).size(text)
+        return (
+            (not self.spec.fit_width or text_width <= self.spec.fit_width)
+            and (not self.spec.fit_height or text_height <= self.spec.fit_height)
+        )
+
+    def fit_font_size(self, text):
+        """Largest size up to spec.font_size at which the text fits the fit box
+
+        Text size is close to proportional to font size, so the search
+        starts at the proportionally scaled size and checks its neighbour;
+        that usually settles it, which keeps the set of trial sizes (and so
+        the per-size metrics kept) small. Otherwise the rest of the range
+        is binary searched.
+        """
+        high = self.spec.font_size
+        if not self.spec.fit_to_box or self._fits(text, high):
+            return high
+
+        text_width, text_height = self.metrics.size(text)
+        scale = min(
+            self.spec.fit_width / text_width if self.spec.fit_width and text_width else 1,
+            self.spec.fit_height / text_height if self.spec.fit_height and text_height else 1
+        )
+        guess = min(max(int(high * scale), MIN_FIT_FONT_SIZE), high - 1)
+        low, best = MIN_FIT_FONT_SIZE, None
+        high -= 1
+        if self._fits(text, guess):
+            if guess == high or not self._fits(text, guess + 1):
+                return guess
+            best, low = guess + 1, guess + 2
+        else:
+            if guess > MIN_FIT_FONT_SIZE and self._fits(text, guess - 1):
+                return guess - 1
+            high = guess - 2
+        while low <= high:
+            middle = (low + high) // 2
+            if self._fits(text, middle):
+                best, low = middle, middle + 1
+            else:
+                high = middle - 1
+        if best is None:
+            raise PositionError("Name doesn't fit in the text box")
+        return best
+
+    def layout(self, text):
+        """Return ``(x, y, font_size)``: where the text goes and at what size"""
+        font_size = self.fit_font_size(text)
+        x, y = self._place(self.metrics_at(font_size).size(text))
+        return x, y, font_size
+
+    def _place(self, text_size):
+        """Top-left corner for text of this size, honoring the position mode"""
+        width, height = self.size
+        text_width, text_height = text_size
+
+        if self.spec.position_mode == "custom":
+            x = self.spec.x - text_width / 2
+            y = self.spec.y - text_height / 2
+            if x < 0 or y < 0 or x > width or y > height:
+                raise PositionError("Position coordinates out of bounds")
+        else:
+            x = (width - text_width) / 2
+            y = (height - text_height) / 2
+        return x, y
+
+    def field_metrics(self, text_field):
+        """TextMetrics for an extra field's font and size"""
+        font_path = text_field.font_path or self.spec.font_path
+        if font_path == self.spec.font_path:
+            return self.metrics_at(text_field.font_size)
+        key = (font_path, text_field.font_size)
+        metrics = self._field_metrics.get(key)
+        if metrics is None:
+            font = load_font(font_path, text_field.font_size)[0]
+            metrics = self._field_metrics[key] = TextMetrics(font, self.template.mode)
+        return metrics
+
+    def field_layouts(self, values):
+        """Return ``(text_field, text, x, y, metrics)`` for each extra field
+
+        ``values`` maps column names to text (an input row works as is);
+        fields whose column is missing or blank are left out.
+        """
+        layouts = []
+        if not values:
+            return layouts
+        width, height = self.size
+        for text_field in self.spec.fields:
+            value = values.get(text_field.column)
+            text = "" if value is None else str(value).strip()
+            if not text:
+                continue
+            if not (0 <= text_field.x <= width and 0 <= text_field.y <= height):
+                raise PositionError(f"Position of field '{text_field.column}' out of bounds")
+            metrics = self.field_metrics(text_field)
+            text_width, text_height = metrics.size(text)
+            x = text_field.x
+            if text_field.align == "center":
+                x -= text_width / 2
+            elif text_field.align == "right":
+                x -= text_width
+            layouts.append((text_field, text, x, text_field.y - text_height / 2, metrics))
+        return layouts
+
+    def render(self, text, values=None):
+        """Return a new image with the text, and any extra fields, drawn on a copy of the template"""
+        x, y, font_size = self.layout(text)
+        img = writable_copy(self.template)
+        draw = ImageDraw.Draw(img)
+        draw.text((x, y), text, fill=self.spec.color, font=self.metrics_at(font_size).font)
+        for text_field, field_text, field_x, field_y, metrics in self.field_layouts(values):
+            draw.text((field_x, field_y), field_text, fill=text_field.color, font=metrics.font)
+        return img
+
+    def render_onto(self, canvas, text, values=None):
+        """Draw the text onto a downscaled copy of the template
+
+        The layout is worked out at full resolution and scaled to the
+        canvas, with the font loaded at the scaled size. The result
+        approximates render() at a fraction of the cost, which is what
+        interactive previews need.
+        """
+        x, y, font_size = self.layout(text)
+        scale = canvas.width / self.size[0]
+        draw = ImageDraw.Draw(canvas)
+        font = load_font(self.spec.font_path, max(round(font_size * scale), MIN_FONT_SIZE))[0]
+        draw.text((x * scale, y * scale), text, fill=self.spec.color, font=font)
+        for text_field, field_text, field_x, field_y, _ in self.field_layouts(values):
+            font = load_font(
+                text_field.font_path or self.spec.font_path,
+                max(round(text_field.font_size * scale), MIN_FONT_SIZE)
+            )[0]
+            draw.text((field_x * scale, field_y * scale), field_text, fill=text_field.color, font=font)
+        return canvas
+
+    def render_incremental(self, text, layout=None, values=None):
+        """Draw the text on a reused canvas, restoring only the last text boxes
+
+        Only the rectangles touched by the previous certificate are copied
+        back from the template, so the per-name pixel work is proportional
+        to the text size rather than the template size. The returned image
+        is shared and is overwritten by the next call, so encode it before
+        rendering again. ``layout`` may be a ``layout(text)`` result the
+        caller already has; ``values`` fills the extra fields.
+        """
+        x, y, font_size = layout or self.layout(text)
+        metrics = self.metrics_at(font_size)
+        field_layouts = self.field_layouts(values)
+        if self._canvas is None:
+            self._canvas = writable_copy(self.template)
+        for box in self._dirty_boxes:
+            self._canvas.paste(self.template.crop(box), box[:2])
+
+        draw = ImageDraw.Draw(self._canvas)
+        draw.text((x, y), text, fill=self.spec.color, font=metrics.font)
+        boxes = [self._text_box(metrics, text, x, y)]
+        for text_field, field_text, field_x, field_y, field_metrics in field_layouts:
+            draw.text((field_x, field_y), field_text, fill=text_field.color, font=field_metrics.font)
+            boxes.append(self._text_box(field_metrics, field_text, field_x, field_y))
+        self._dirty_boxes = [box for box in boxes if box]
+        return self._canvas
+
+    def _text_box(self, metrics, text, x, y):
+        """Template area covered by text drawn at (x, y)"""
+        left, top, right, bottom = metrics.bbox(text)
+        return self._clip_box((x + left, y + top, x + right, y + bottom))
+
+    def _clip_box(self, bbox):
+        """Round a text bbox outwards (with a pixel of slack for antialiasing)
+        and clip it to the template; returns None if nothing is visible"""
+        width, height = self.size
+        left = max(int(bbox[0]) - 1, 0)
+        top = max(int(bbox[1]) - 1, 0)
+        right = min(int(bbox[2]) + 2, width)
+        bottom = min(int(bbox[3]) + 2, height)
+        if left >= right or top >= bottom:
+            return None
+        return left, top, right, bottom
+
+    def encode(self, img, output):
+        """Encode a rendered certificate into bytes"""
+        buffer = io.BytesIO()
+        encode_image(img, buffer, output.encoder)
+        return buffer.getvalue()
+
@@ -0,0 +1,170 @@
+"""Run reports: a JSON summary of every batch, written next to its output.
+
+The report records counts, throughput, bytes written, the time spent
+per pipeline stage and every failure, so a slow or failing run can be
+diagnosed after the fact. RunProfiler adds opt-in cProfile and
+tracemalloc captures for deeper dives.
+"""
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from dataclasses import asdict
+
+REPORT_VERSION = 1
+REPORT_PREFIX = "certificates_report_"
+# Order stages are listed in; anything else recorded is appended after these
+STAGE_ORDER = ("load", "measure", "draw", "encode", "pdf", "write", "copy", "manifest")
+# Functions / allocation sites kept from a profile
+PROFILE_TOP = 15
+
+
+class RunProfiler:
+    """Opt-in CPU (cProfile) and memory (tracemalloc) capture around a batch
+
+    Only this process is profiled: with several jobs the worker processes
+    are not, so profile with one job to see the rendering code itself.
+    """
+
+    def __init__(self, cpu=False, memory=False):
+        self.cpu = cpu
+        self.memory = memory
+        self._profile = None
+        self._snapshot = None
+        self._peak = 0
+
+    def __enter__(self):
+        if self.memory:
+            tracemalloc.start()
+        if self.cpu:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._profile is not None:
+            self._profile.disable()
+        if self.memory:
+            self._snapshot = tracemalloc.take_snapshot()
+            self._peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return False
+
+    def results(self, profile_path=None):
+        """Summary for the run report; the full CPU profile goes to profile_path"""
+        summary = {}
+        if self._profile is not None:
+            if profile_path:
+                self._profile.dump_stats(profile_path)
+                summary["cpu_profile"] = profile_path
+            stats = pstats.Stats(self._profile).stats
+            slowest = sorted(stats.items(), key=lambda entry: entry[1][3], reverse=True)
+            summary["cpu_top"] = [
+                {
+                    "function": f"{os.path.basename(filename)}:{line}({function})",
+                    "calls": calls,
+                    "own_seconds": round(own, 4),
+                    "cumulative_seconds": round(cumulative, 4),
+                }
+                for (filename, line, function), (_, calls, own, cumulative, _) in slowest[:PROFILE_TOP]
+            ]
+        if self._snapshot is not None:
+            summary["memory_peak_bytes"] = self._peak
+            summary["memory_top"] = [
+                {"where": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                for stat in self._snapshot.statistics("lineno")[:PROFILE_TOP]
+            ]
+        return summary
+
+
+def _ordered_stages(stats):
+    known = [stage for stage in STAGE_ORDER if stage in stats.stage_seconds]
+    return known + sorted(set(stats.stage_seconds) - set(known))
+
+
+def build_report(result, output, cancelled=False, profile=None):
+    """Assemble the run report for a BatchResult as a JSON-ready dict"""
+    stats = result.stats
+    stages = {}
+    for stage in _ordered_stages(stats):
+        seconds = stats.stage_seconds[stage]
+        count = stats.stage_counts[stage]
+        stages[stage] = {
+            "seconds": round(seconds, 4),
+            "count": count,
+            "mean_ms": round(seconds / count * 1000, 3),
+            "max_ms": round(stats.stage_max[stage] * 1000, 3),
+        }
+
+    report = {
+        "version": REPORT_VERSION,
+        "finished": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "status": "cancelled" if cancelled else "completed",
+        "output": result.archive_path or output.output_dir,
+        "encoder": asdict(output.encoder),
+        "jobs": result.jobs,
+        "generated": result.success_count,
+        "skipped": result.skipped_count,
+        "reused": result.reused_count,
+        "failed": len(result.failed_names),
+        "elapsed_seconds": round(stats.elapsed, 3),
+        "certificates_per_sec": round(result.success_count / stats.elapsed, 2) if stats.elapsed else None,
+        "bytes_written": stats.bytes_written,
+        "stages": stages,
+        "failures": result.failed_names,
+    }
+    if profile:
+        report["profile"] = profile
+    return report
+
+
+def report_path(output_dir, extension=".json"):
+    """Return an unused, timestamped report path in output_dir"""
+    stem = os.path.join(output_dir, REPORT_PREFIX + time.strftime("%Y%m%d-%H%M%S"))
+    path = stem + extension
+    counter = 1
+    while os.path.exists(path):
+        path = f"{stem}_{counter}{extension}"
+        counter += 1
+    return path
+
+
+def write_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return path
+
+
+def format_bytes(size):
+    for unit in ("bytes", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "bytes" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def summary_lines(report):
+    """Human-readable summary of a run report, one line per fact"""
+    lines = [f"{report['generated']} certificates generated"]
+    if report["reused"]:
+        lines.append(f"{report['reused']} duplicates copied instead of rendered again")
+    if report["skipped"]:
+        lines.append(f"{report['skipped']} already generated (skipped)")
+    if report["failed"]:
+        lines.append(f"{report['failed']} failed")
+
+    rate = report["certificates_per_sec"]
+    timing = f"{report['elapsed_seconds']:.1f} s"
+    if rate:
+        timing += f" ({rate:.1f} certificates/sec)"
+    lines.append(f"{timing}, {format_bytes(report['bytes_written'])} written")
+
+    total = sum(stage["seconds"] for stage in report["stages"].values())
+    if total:
+        busiest = sorted(report["stages"].items(), key=lambda entry: entry[1]["seconds"], reverse=True)
+        lines.append("Time by stage: " + ", ".join(
+            f"{stage} {values['seconds'] / total:.0%}" for stage, values in busiest if values["seconds"]
+        ))
+    return lines
@@ -0,0 +1,76 @@
+"""Archive sinks: stream encoded certificates into a single ZIP or TAR file.
+
+Writing one archive through one file handle avoids the per-file create
+and metadata cost of thousands of loose files, which dominates on network
+shares. Certificates are already compressed images, so ZIP entries are
+stored rather than deflated again.
+"""
+import io
+import os
+import tarfile
+import time
+import zipfile
+
+ARCHIVE_EXTENSIONS = {
+    "zip": ".zip",
+    "tar": ".tar",
+}
+
+
+class ZipSink:
+    """Appends certificates to a ZIP archive without recompressing them"""
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED, allowZip64=True)
+
+    def write(self, filename, data):
+        info = zipfile.ZipInfo(filename, date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_STORED
+        self._zip.writestr(info, data)
+
+    def close(self):
+        self._zip.close()
+
+
+class TarSink:
+    """Appends certificates to an uncompressed TAR archive"""
+
+    def __init__(self, path):
+        self.path = path
+        self._tar = tarfile.open(path, "w")
+
+    def write(self, filename, data):
+        info = tarfile.TarInfo(filename)
+        info.size = len(data)
+        info.mtime = time.time()
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        self._tar.close()
+
+
+SINKS = {
+    "zip": ZipSink,
+    "tar": TarSink,
+}
+
+
+def archive_path(output_dir, kind, stem="certificates"):
+    """Return an unused archive path in output_dir"""
+    extension = ARCHIVE_EXTENSIONS[kind]
+    path = os.path.join(output_dir, f"{stem}{extension}")
+    counter = 1
+    while os.path.exists(path):
+        path = os.path.join(output_dir, f"{stem}_{counter}{extension}")
+        counter += 1
+    return path
+
+
+def open_archive_sink(output):
+    """Create the archive sink for an OutputSpec with ``archive`` set"""
+    try:
+        sink_class = SINKS[output.archive]
+    except KeyError:
+        raise ValueError(f"Unknown archive type '{output.archive}'")
+    return sink_class(archive_path(output.output_dir, output.archive))
@@ -0,0 +1,112 @@
+"""Streaming name input from CSV, TSV, JSONL and plain text files.
+
+Files are read lazily one line at a time so arbitrarily large name lists
+can be fed to the batch pipeline with bounded memory.
+"""
+import csv
+import json
+import os
+
+# Column used for the name when none is given and the header has no "name"
+NAME_FIELD = "name"
+
+FORMATS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+def detect_format(path):
+    """Guess the input format from the file extension (defaults to text)"""
+    return FORMATS.get(os.path.splitext(path)[1].lower(), "text")
+
+
+class NameSource:
+    """Lazily reads names, and any other per-row fields, from a file
+
+    - CSV/TSV files must have a header row. The name comes from
+      ``name_field``, else a column called "name" (any case), else the
+      first column.
+    - JSONL files hold one object per line (the name is read from
+      ``name_field`` or "name") or one JSON string per line.
+    - Anything else is plain text with one name per line.
+
+    Iterating yields the non-blank names; ``rows()`` yields each row as a
+    dict. Because the total row count is unknown up front, ``fraction()``
+    reports progress as the share of the file read so far.
+    """
+
+    def __init__(self, path, name_field=None, encoding="utf-8-sig"):
+        self.path = path
+        self.name_field = name_field
+        self.encoding = encoding
+        self.format = detect_format(path)
+        self.total_bytes = os.path.getsize(path)
+        self.bytes_read = 0
+
+    def fraction(self):
+        """Share of the file consumed so far, between 0 and 1"""
+        if not self.total_bytes:
+            return 1.0
+        return min(self.bytes_read / self.total_bytes, 1.0)
+
+    def _lines(self):
+        """Yield decoded lines while counting the bytes consumed"""
+        self.bytes_read = 0
+        with open(self.path, "rb") as f:
+            for raw in f:
+                self.bytes_read += len(raw)
+                yield raw.decode(self.encoding)
+
+    def _pick_name_field(self, fieldnames):
+        if self.name_field:
+            if self.name_field not in fieldnames:
+                raise ValueError(f"Column '{self.name_field}' not found in {self.path}")
+            return self.name_field
+        for field in fieldnames:
+            if field.strip().lower() == NAME_FIELD:
+                return field
+        return fieldnames[0]
+
+    def rows(self):
+        """Yield one dict per input row, with the name under "name" """
+        if self.format in ("csv", "tsv"):
+            yield from self._delimited_rows("," if self.format == "csv" else "\t")
+        elif self.format == "jsonl":
+            yield from self._jsonl_rows()
+        else:
+            for line in self._lines():
+                yield {NAME_FIELD: line.strip()}
+
+    def _delimited_rows(self, delimiter):
+        reader = csv.DictReader(self._lines(), delimiter=delimiter)
+        if not reader.fieldnames:
+            return
+        name_field = self._pick_name_field(reader.fieldnames)
+        for row in reader:
+            row[NAME_FIELD] = (row.get(name_field) or "").strip()
+            yield row
+
+    def _jsonl_rows(self):
+        name_field = self.name_field or NAME_FIELD
+        for line_number, line in enumerate(self._lines(), 1):
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{self.path}, line {line_number}: {e}")
+            if isinstance(value, dict):
+                row = dict(value)
+                row[NAME_FIELD] = str(value.get(name_field) or "").strip()
+            else:
+                row = {NAME_FIELD: str(value).strip()}
+            yield row
+
+    def __iter__(self):
+        for row in self.rows():
+            if row[NAME_FIELD]:
+                yield row[NAME_FIELD]
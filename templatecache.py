@@ -0,0 +1,277 @@
+"""On-disk cache of decoded templates, shared across runs and processes.
+
+Decoding a large progressive JPEG or 16-bit PNG and converting it to RGB
+can take seconds, and every session and every worker process used to do
+it again. The decoded pixels are instead stored once as raw buffers (the
+template and its preview pyramid levels) under the user's cache
+directory, keyed by the template's content hash. Later loads map the
+buffers from disk with Image.frombuffer, so nothing is decoded or copied
+until pixels are actually touched.
+
+Pillow keeps RGB pixels in four bytes, so the buffers are stored as RGBX
+and mapped images have that mode: they read like RGB, but need a
+convert("RGB") (which is only a copy) wherever a writable RGB image is
+wanted.
+
+Batches across worker processes go through SharedTemplate: the parent
+places the decoded template in one raw file (the cache entry, or a
+temporary file when the cache is off) and every worker maps it, so the
+template is in memory once however many workers there are.
+
+Set CERTGEN_TEMPLATE_CACHE to a directory to move the cache, or to "off"
+to disable it.
+"""
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+
+from PIL import Image
+
+CACHE_ENV = "CERTGEN_TEMPLATE_CACHE"
+CACHE_VERSION = 1
+# Entries are evicted, least recently used first, above this total size
+MAX_CACHE_BYTES = 2 << 30
+# Pyramid levels are stored down to this size
+PYRAMID_MIN_SIZE = (64, 64)
+META_NAME = "meta.json"
+DISABLED_VALUES = ("off", "0", "no", "false")
+
+
+def default_cache_dir():
+    """Per-user cache location (XDG on Linux, LOCALAPPDATA on Windows)"""
+    base = (
+        os.environ.get("XDG_CACHE_HOME")
+        or os.environ.get("LOCALAPPDATA")
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(base, "certificate-generator", "templates")
+
+
+def decode_template(path):
+    """Decode a template image and convert it to RGB"""
+    with Image.open(path) as template:
+        return template.convert("RGB")
+
+
+def _write_atomic(path, data):
+    """Write a file so readers only ever see it complete"""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _map_raw(path, size, private=False):
+    """RGBX image backed by a memory-mapped raw file
+
+    The image is read-only unless ``private``, in which case the mapping is
+    copy-on-write: drawing on it copies just the pages it touches into this
+    process and never changes the file.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size != size[0] * size[1] * 4:
+            raise ValueError(f"Truncated cache file {path}")
+        access = mmap.ACCESS_COPY if private else mmap.ACCESS_READ
+        buffer = mmap.mmap(f.fileno(), 0, access=access)
+    # The image keeps the mapping alive; the file handle isn't needed
+    image = Image.frombuffer("RGBX", tuple(size), buffer, "raw", "RGBX", 0, 1)
+    if private:
+        # frombuffer always marks mapped images read-only; this buffer is writable
+        image.readonly = 0
+    return image
+
+
+class TemplateCache:
+    """Decoded templates and pyramid levels stored as raw, mappable files
+
+    Entries live in ``<root>/<content sha256>/``. Content hashes are
+    remembered per source path together with its size and mtime, so an
+    unchanged file is not hashed again. Files are written atomically, so
+    several processes can fill and read the cache at the same time; any
+    cache failure falls back to decoding the template normally.
+    """
+
+    def __init__(self, root, max_bytes=MAX_CACHE_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_environment(cls):
+        """The cache configured by CERTGEN_TEMPLATE_CACHE, or None if disabled"""
+        setting = os.environ.get(CACHE_ENV, "").strip()
+        if setting.lower() in DISABLED_VALUES:
+            return None
+        return cls(setting or default_cache_dir())
+
+    def content_digest(self, path):
+        """SHA-256 of a file, looked up by path, size and mtime when possible"""
+        stat = os.stat(path)
+        abspath = os.path.abspath(path)
+        index_path = os.path.join(
+            self.root, "index", hashlib.sha1(abspath.encode("utf-8")).hexdigest() + ".json"
+        )
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                return entry["digest"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        entry = {"path": abspath, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+        _write_atomic(index_path, json.dumps(entry).encode("utf-8"))
+        return digest
+
+    def load(self, path):
+        """The decoded template: mapped RGBX from the cache, or RGB if it can't be cached"""
+        return self.load_levels(path)[0]
+
+    def load_levels(self, path):
+        """The decoded template followed by its successively halved pyramid levels"""
+        try:
+            return self._entry(path)[1]
+        except (OSError, ValueError):
+            # An unwritable or damaged cache must never stop a render
+            return [decode_template(path)]
+
+    def raw_template(self, path):
+        """Path and size of the template's raw RGBX file, decoding it first if
+        needed; raises OSError or ValueError if the cache can't be used"""
+        entry_dir, levels = self._entry(path)
+        return os.path.join(entry_dir, "level0.raw"), levels[0].size
+
+    def _entry(self, path):
+        entry_dir = os.path.join(self.root, self.content_digest(path))
+        levels = self._read_entry(entry_dir)
+        if levels is None:
+            levels = self._store(path, entry_dir)
+        return entry_dir, levels
+
+    def _read_entry(self, entry_dir):
+        meta_path = os.path.join(entry_dir, META_NAME)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("version") != CACHE_VERSION:
+            return None
+        try:
+            levels = [
+                _map_raw(os.path.join(entry_dir, f"level{index}.raw"), size)
+                for index, size in enumerate(meta["levels"])
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Damaged, or partly deleted: treat it as missing so it is written again
+            return None
+        if not levels:
+            return None
+        # The metadata's mtime records when the entry was last used, for eviction
+        os.utime(meta_path)
+        return levels
+
+    def _store(self, path, entry_dir):
+        template = decode_template(path)
+        levels = [template]
+        level = template
+        while level.width // 2 >= PYRAMID_MIN_SIZE[0] and level.height // 2 >= PYRAMID_MIN_SIZE[1]:
+            level = level.reduce(2)
+            levels.append(level)
+
+        os.makedirs(entry_dir, exist_ok=True)
+        for index, level in enumerate(levels):
+            _write_atomic(os.path.join(entry_dir, f"level{index}.raw"), level.tobytes("raw", "RGBX"))
+        # Written last: an entry without metadata is incomplete and ignored
+        meta = {"version": CACHE_VERSION, "levels": [list(level.size) for level in levels]}
+        _write_atomic(os.path.join(entry_dir, META_NAME), json.dumps(meta).encode("utf-8"))
+        try:
+            self.prune(keep=entry_dir)
+        except OSError:
+            pass
+        return levels
+
+    def prune(self, keep=None):
+        """Evict least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.root):
+            if not entry.is_dir() or entry.name == "index":
+                continue
+            try:
+                used = os.stat(os.path.join(entry.path, META_NAME)).st_mtime
+            except OSError:
+                used = 0
+            size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+            entries.append((used, entry.path, size))
+            total += size
+
+        for _, entry_path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry_path == keep:
+                continue
+            # Mapped files can't be deleted on Windows; they go next time
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total -= size
+
+
+class SharedTemplate:
+    """A decoded template in a raw file for worker processes to map
+
+    Created once by the parent process and passed (pickled) to workers,
+    which map the file instead of decoding the template themselves. Mapped
+    pages live in the OS page cache, so the pixels are held once no matter
+    how many processes map them.
+    """
+
+    def __init__(self, path, size, temporary=False):
+        self.path = path
+        self.size = tuple(size)
+        # A temporary file belongs to the batch and is deleted by close()
+        self.temporary = temporary
+
+    @classmethod
+    def create(cls, template_path, cache=None):
+        """Use the cache entry for the template, or write a temporary raw file"""
+        if cache is not None:
+            try:
+                return cls(*cache.raw_template(template_path))
+            except (OSError, ValueError):
+                pass
+        template = decode_template(template_path)
+        fd, path = tempfile.mkstemp(prefix="certificate-template-", suffix=".raw")
+        with os.fdopen(fd, "wb") as f:
+            f.write(template.tobytes("raw", "RGBX"))
+        return cls(path, template.size, temporary=True)
+
+    def open(self):
+        """The template as a read-only RGBX image"""
+        return _map_raw(self.path, self.size)
+
+    def open_private(self):
+        """A drawable RGBX copy of the template that only copies the pages drawn on"""
+        return _map_raw(self.path, self.size, private=True)
+
+    def close(self):
+        """Remove a temporary file; workers that mapped it keep their mapping"""
+        if self.temporary:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
@@ -0,0 +1,32 @@
+"""Output filenames stay within filesystem limits for names in any script."""
+import os
+
+import pytest
+
+from renderer import MAX_FILENAME_BYTES, OutputAllocator, OutputSpec, safe_filename
+
+LONG_NAMES = [
+    "李" * 100,                   # CJK: 3 bytes per letter in UTF-8
+    "\U0001D49C" * 100,           # astral-plane letters: 4 bytes each
+    "Ana " + "é" * 200,           # 2-byte letters after ASCII
+    "a" * 2 + "李" * 90,          # cut falls mid-character
+]
+
+
+@pytest.mark.parametrize("name", LONG_NAMES)
+def test_slug_cut_at_character_boundary(name):
+    slug = safe_filename(name, max_bytes=100)
+    data = slug.encode("utf-8")
+    assert 0 < len(data) <= 100
+    assert data.decode("utf-8") == slug
+
+
+@pytest.mark.parametrize("name", LONG_NAMES)
+def test_long_names_can_be_written_twice(tmp_path, name):
+    allocator = OutputAllocator(OutputSpec(str(tmp_path), prefix="certificate_"))
+    for _ in range(12):
+        path = allocator.allocate(name)
+        assert len(os.path.basename(path).encode("utf-8")) <= MAX_FILENAME_BYTES
+        with open(path, "wb") as f:
+            f.write(b"x")
+    assert len(os.listdir(tmp_path)) == 12